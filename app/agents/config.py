@@ -1,4 +1,7 @@
 from functools import lru_cache
+
+import httpx
+
 from app.core.config import get_settings
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.models.openai import OpenAIChatModel
@@ -14,12 +17,22 @@ def get_openai_provider() -> OpenAIProvider:
 
     if not settings.llm_api_key:
         raise ValueError("LLM_API_KEY must be set in environment variables")
+
+    # Size the pool to the annotation fan-out; httpx caps at 100 connections by default
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max(200, settings.max_concurrent_annotations * 4),
+            max_keepalive_connections=settings.max_concurrent_annotations * 2,
+        ),
+        timeout=httpx.Timeout(120.0),
+    )
     if settings.llm_base_url:
         return OpenAIProvider(
             api_key=settings.llm_api_key,
             base_url=settings.llm_base_url,
+            http_client=http_client,
         )
-    return OpenAIProvider(api_key=settings.llm_api_key)
+    return OpenAIProvider(api_key=settings.llm_api_key, http_client=http_client)
 
 
 @lru_cache(maxsize=1)
@@ -1,3 +1,4 @@
+import httpx
 from pydantic_ai import Agent, ModelSettings
 from pydantic_ai.mcp import MCPServerStreamableHTTP
 
@@ -7,14 +8,24 @@ from app.agents.prompts.data_agent_prompt import PROMPT_DATA_AGENT
 
 settings = get_settings()
 
-mcp_client = MCPServerStreamableHTTP(url="http://localhost:8001/mcp/", max_retries=3)
+# One pooled client for every tool call; reads stay long enough for SSE responses
+mcp_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=64),
+    timeout=httpx.Timeout(30.0, read=300.0),
+)
+
+mcp_client = MCPServerStreamableHTTP(
+    url="http://localhost:8001/mcp/", max_retries=3, http_client=mcp_http_client
+)
 
 
 data_agent = Agent(
     model=get_llm_model(),
     name="Data Agent",
-    instructions=f"{PROMPT_DATA_AGENT}",
+    instructions=PROMPT_DATA_AGENT,
     toolsets=[mcp_client],
-    model_settings=ModelSettings(max_tokens=16384, temperature=0.3),
+    model_settings=ModelSettings(
+        max_tokens=16384, temperature=0.3, parallel_tool_calls=True
+    ),
     output_type=str,
 )
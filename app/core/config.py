@@ -1,5 +1,6 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Literal
 
 from pydantic import AliasChoices, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -8,10 +9,17 @@ from pydantic_settings.sources import (
     PyprojectTomlConfigSettingsSource,
 )
 
-from app.core.db_registry import DatabaseRegistry
+from app.core.db_registry import DatabaseRegistry, load_toml
 from app.schemas.config import ExtractionOptions
 
 
+class CachedPyprojectTomlSettingsSource(PyprojectTomlConfigSettingsSource):
+    """pyproject.toml source that reuses the parsed file until it changes."""
+
+    def _read_file(self, file_path: Path) -> dict[str, Any]:
+        return load_toml(file_path)
+
+
 class Settings(BaseSettings):
     """
     Settings for the application.
@@ -47,14 +55,33 @@ class Settings(BaseSettings):
         default=25,
         description="Force a limit on the number of rows returned by SQL queries on MCP tool calls.",
     )
+    widget_query_cache_ttl_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="How long OpenBB widget query results are reused for identical requests; 0 (default) disables, since cached rows hide recent writes.",
+    )
 
     lance_db_path: Path = Field(
         default=Path("./data/lance_db"),
         description="Path to the LanceDB database for storing table annotations.",
     )
+    metadata_cache_dir: Path = Field(
+        default=Path("./data/metadata_cache"),
+        description="Directory for reflected schema metadata reused across restarts.",
+    )
     n_dims: int = Field(
-        default=768,
-        description="Dimensionality of the embedding vectors.",
+        default=256,
+        description=(
+            "Dimensionality of the embedding vectors. Model output is truncated to"
+            " this size (Matryoshka), so changing it requires rebuilding LanceDB tables."
+        ),
+    )
+    embedding_precision: Literal["float32", "ubinary"] = Field(
+        default="float32",
+        description=(
+            "Storage precision for table annotation embeddings. 'ubinary' packs one"
+            " sign bit per dimension (n_dims / 8 bytes) for hamming-distance search."
+        ),
     )
     embedding_model_name: str = Field(
         default="google/embeddinggemma-300m",
@@ -64,6 +91,38 @@ class Settings(BaseSettings):
         default="cpu",
         description="Device to run the embedding model on (e.g., 'cpu', 'cuda').",
     )
+    embedding_batch_size: int = Field(
+        default=64,
+        ge=1,
+        description=(
+            "Annotations encoded per embedding forward pass, pooled across databases."
+            " Raise it on GPUs with memory to spare."
+        ),
+    )
+    embedding_cpu_int8: bool = Field(
+        default=False,
+        description=(
+            "Apply dynamic int8 quantization to the embedding model's linear layers"
+            " when running on CPU. Faster, but embeddings drift slightly from fp32 ones."
+        ),
+    )
+
+    vector_index_min_rows: int = Field(
+        default=4096,
+        ge=1,
+        description="Row count at which LanceDB vector columns get an IVF index instead of brute-force search.",
+    )
+
+    qa_cache_max_distance: float = Field(
+        default=0.08,
+        ge=0.0,
+        description="Maximum cosine distance for a question to reuse a cached data agent answer.",
+    )
+    qa_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="How long cached data agent answers stay valid, in seconds.",
+    )
 
     annotate_on_startup: bool = Field(
         default=True,
@@ -73,11 +132,31 @@ class Settings(BaseSettings):
         default=32,
         description="Maximum number of concurrent table annotations to prevent resource exhaustion.",
     )
+    annotation_batch_size: int = Field(
+        default=8,
+        ge=1,
+        description="Number of tables described per LLM call; keep the combined prompt within the model context.",
+    )
     fts_extraction_options: ExtractionOptions = Field(
-        default_factory=ExtractionOptions,
+        default=ExtractionOptions(),
         description="Column-content extraction tuning for FTS indexing.",
     )
 
+    schema_probe_ttl_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        description="How long a schema version probe is trusted before reflected metadata is revalidated.",
+    )
+    warm_connection_pools: bool = Field(
+        default=True,
+        description="Open each database's pooled connections on startup so first tool calls skip the handshake.",
+    )
+    schema_discovery_timeout_s: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to wait for a database's schema discovery before startup fails.",
+    )
+
     allowed_sql_commands: tuple[str, ...] = Field(
         default=(
             "SELECT",
@@ -103,7 +182,7 @@ class Settings(BaseSettings):
         return (
             env_settings,
             dotenv_settings,
-            PyprojectTomlConfigSettingsSource(settings_cls),
+            CachedPyprojectTomlSettingsSource(settings_cls),
             file_secret_settings,
             init_settings,
         )
@@ -137,6 +216,12 @@ class Settings(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_embedding_precision(self) -> "Settings":
+        if self.embedding_precision == "ubinary" and self.n_dims % 8:
+            raise ValueError("n_dims must be a multiple of 8 for ubinary embeddings")
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,6 +1,8 @@
+import tomllib
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from app.schemas.config import DatabaseConfig
 
 
@@ -60,18 +62,34 @@ class DatabaseRegistry(BaseModel):
 
     @classmethod
     def from_toml(cls, path: Path) -> "DatabaseRegistry":
-        import tomllib
-
-        data = tomllib.loads(path.read_text())
+        data = load_toml(path)
         return cls(**data)
 
 
+def load_toml(path: Path) -> dict:
+    """Parse a TOML file, reusing the result until the file changes."""
+    return _parse_toml(path.resolve(), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_toml(path: Path, mtime_ns: int) -> dict:
+    with path.open("rb") as f:
+        return tomllib.load(f)
+
+
 class TableMetadata(BaseModel):
     columns: list[dict]
     primary_keys: dict
     foreign_keys: list[dict]
     indexes: list[dict]
 
+    _create_table_cache: dict[tuple[str, bool], str] = PrivateAttr(default_factory=dict)
+
+    @cached_property
+    def metadata_json(self) -> str:
+        """JSON dump used for storage and schema hashing, serialized once."""
+        return self.model_dump_json()
+
     @classmethod
     def from_sqlalchemy(cls, raw: dict) -> "TableMetadata":
         def serialize_column(col: dict) -> dict:
@@ -98,7 +116,14 @@ class TableMetadata(BaseModel):
         Args:
             table_name: Name of the table
             include_indexes: If True, append CREATE INDEX statements after the table
+
+        The rendered statement is memoized per instance, since reflected metadata
+        is cached and rendered repeatedly for prompts and tool calls.
         """
+        key = (table_name, include_indexes)
+        if (cached := self._create_table_cache.get(key)) is not None:
+            return cached
+
         column_defs = [
             f"  {col['name']} {col.get('type', 'UNKNOWN')}"
             + ("" if col.get("nullable", True) else " NOT NULL")
@@ -129,4 +154,6 @@ class TableMetadata(BaseModel):
                 if idx.get("column_names")
             )
 
-        return "\n".join(parts)
+        statement = "\n".join(parts)
+        self._create_table_cache[key] = statement
+        return statement
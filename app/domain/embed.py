@@ -1,9 +1,17 @@
+import asyncio
 from functools import lru_cache
+from typing import TYPE_CHECKING, Literal
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    # torch and sentence-transformers take seconds to import; load them with the model
+    from sentence_transformers import SentenceTransformer
+
+_encode_lock = asyncio.Lock()
+
 
 class EmbeddingGenerator:
     """Domain service for generating embeddings."""
@@ -16,33 +24,87 @@ class EmbeddingGenerator:
         settings = get_settings()
         self.model_name = model_name or settings.embedding_model_name
         self.device = device or settings.device
+        self.n_dims = settings.n_dims
+        self.cpu_int8 = settings.embedding_cpu_int8
         self._model = None
 
     @property
-    def model(self) -> SentenceTransformer:
+    def model(self) -> "SentenceTransformer":
         """Lazy-load the embedding model."""
         if self._model is None:
-            self._model = _load_model(self.model_name, self.device)
+            self._model = _load_model(
+                self.model_name, self.device, self.n_dims, self.cpu_int8
+            )
         return self._model
 
     async def generate_batch(
-        self, texts: list[str], batch_size: int = 32
-    ) -> list[list[float]]:
-        """Generate embeddings for multiple texts."""
-        embeddings = self.model.encode(texts, batch_size=batch_size).tolist()
-        return embeddings
+        self,
+        texts: list[str],
+        batch_size: int = 64,
+        precision: Literal["float32", "ubinary"] = "float32",
+    ) -> np.ndarray:
+        """Generate embeddings for multiple texts as a (len(texts), dims) array.
+
+        With `precision="ubinary"` each vector is quantized to its sign bits and
+        packed into uint8 values (n_dims / 8 per vector).
+        """
+        # Encode (and lazily load the model) off the event loop, one batch at a time
+        async with _encode_lock:
+            return await asyncio.to_thread(self._encode, texts, batch_size, precision)
+
+    def _encode(
+        self,
+        texts: list[str],
+        batch_size: int,
+        precision: Literal["float32", "ubinary"],
+    ) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            precision=precision,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+    async def warmup(self) -> None:
+        """Load the model and run a small encode so the first real request is fast."""
+        await self.generate_batch(["warmup"] * 8)
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
-    async def generate(self, text: str) -> list[float]:
+    async def generate(self, text: str) -> np.ndarray:
         """Generate embedding for a single text."""
         results = await self.generate_batch([text])
         return results[0]
 
 
 @lru_cache(maxsize=4)
-def _load_model(name: str, device: str) -> SentenceTransformer:
-    """Load and cache embedding model."""
-    return SentenceTransformer(
+def _load_model(
+    name: str, device: str, truncate_dim: int, cpu_int8: bool = False
+) -> "SentenceTransformer":
+    """Load and cache embedding model.
+
+    Output is truncated to `truncate_dim` dimensions, which keeps most of the
+    retrieval quality for Matryoshka-trained models such as EmbeddingGemma.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(
         model_name_or_path=name,
         device=device,
         trust_remote_code=True,
+        truncate_dim=truncate_dim,
     )
+    if device.startswith("cuda"):
+        # bf16 rather than fp16: EmbeddingGemma activations overflow in fp16
+        model.to(torch.bfloat16)
+        torch.backends.cuda.matmul.allow_tf32 = True
+    elif device == "cpu" and cpu_int8:
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return model
@@ -1,27 +1,28 @@
 from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from typing import Any
 
-from sqlalchemy import column, select, table
+from sqlalchemy import column, literal, select, table, union_all
 from sqlalchemy.engine import Connection
 from sqlalchemy.sql.sqltypes import (
+    BINARY,
+    BLOB,
     JSON,
+    VARBINARY,
+    Date,
     LargeBinary,
     NullType,
     String,
     Text,
     Unicode,
     UnicodeText,
-    BLOB,
-    BINARY,
-    VARBINARY,
-    Date,
 )
 
-from app.repositories.sql_db import connection_scope, get_inspector
-from app.models.lance import ColumnContent
-from app.core.logging import get_logger
 from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.models.lance import ColumnContent
+from app.repositories.sql_db import connection_scope, get_inspector
 from app.schemas.config import ExtractionOptions
 
 logger = get_logger(__name__)
@@ -43,6 +44,11 @@ _SKIP_TYPES = (
     Date,
 )
 
+_NUMERIC_CHARS = frozenset("0123456789+-._eE")
+_NON_FINITE = frozenset(
+    f"{sign}{word}" for sign in ("", "+", "-") for word in ("nan", "inf", "infinity")
+)
+
 
 def extract_column_contents(
     database: str,
@@ -74,19 +80,20 @@ def extract_column_contents(
             target_schemas = (default_schema,)
 
         table_columns: dict[tuple[str, str], Sequence[Any]] = {
-            (schema_name, table_name): inspector.get_columns(
-                table_name, schema=schema_name
-            )
+            (schema_name, table_name): columns
             for schema_name in target_schemas
-            for table_name in inspector.get_table_names(schema=schema_name)
+            for (_, table_name), columns in inspector.get_multi_columns(
+                schema=schema_name
+            ).items()
         }
 
-        tasks: list[tuple[str, str, str]] = [
-            (schema_name, table_name, col["name"])
-            for (schema_name, table_name), columns in table_columns.items()
-            for col in columns
-            if _is_textual_column(col["type"])
-        ]
+        tasks: dict[tuple[str, str], list[str]] = {}
+        for (schema_name, table_name), columns in table_columns.items():
+            textual = [
+                col["name"] for col in columns if _is_textual_column(col["type"])
+            ]
+            if textual:
+                tasks[(schema_name, table_name)] = textual
 
         if not tasks:
             logger.warning(
@@ -100,37 +107,34 @@ def extract_column_contents(
         results: list[ColumnContent] = []
         total_skipped = 0
 
+        # One task (and one pooled connection) per table, columns scanned in turn
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
             futures = {
                 pool.submit(
-                    _collect_column_values,
+                    _collect_table_values,
                     database,
                     schema_name,
                     table_name,
-                    column_name,
+                    column_names,
                     options,
-                ): (schema_name, table_name, column_name)
-                for schema_name, table_name, column_name in tasks
+                ): (schema_name, table_name)
+                for (schema_name, table_name), column_names in tasks.items()
             }
 
             for future in as_completed(futures):
-                schema_name, table_name, column_name = futures[future]
+                schema_name, table_name = futures[future]
                 try:
-                    column_content = future.result()
-                except Exception:  # noqa: BLE001
+                    table_contents, skipped = future.result()
+                except Exception:
                     logger.exception(
-                        "Failed to extract values for %s.%s.%s",
+                        "Failed to extract values for %s.%s",
                         schema_name,
                         table_name,
-                        column_name,
                     )
                     continue
 
-                if column_content is None:
-                    total_skipped += 1
-                    continue
-
-                results.append(column_content)
+                results.extend(table_contents)
+                total_skipped += skipped
 
         logger.debug(
             "Extracted textual values for %d columns (skipped %d) in database '%s' for schemas %s.",
@@ -142,7 +146,81 @@ def extract_column_contents(
         return results
 
 
+def _collect_table_values(
+    database: str,
+    schema_name: str,
+    table_name: str,
+    column_names: Sequence[str],
+    options: ExtractionOptions,
+) -> tuple[list[ColumnContent], int]:
+    """Collect values for all textual columns of a table over one connection.
+
+    Returns the extracted column contents and the number of skipped columns.
+    """
+    contents: list[ColumnContent] = []
+    skipped = 0
+    limit = options.max_values_per_column
+    with connection_scope(database) as conn:
+        if len(column_names) > 1:
+            try:
+                values_by_column = _fetch_distinct_by_column(
+                    conn, table_name, column_names, schema=schema_name, limit=limit + 1
+                )
+            except Exception:
+                logger.debug(
+                    "Fused distinct scan failed for %s.%s, falling back to per-column queries.",
+                    schema_name,
+                    table_name,
+                    exc_info=True,
+                )
+                conn.rollback()
+            else:
+                for column_name in column_names:
+                    values = values_by_column.get(column_name, [])
+                    if len(values) > limit:
+                        logger.debug(
+                            f"Skipping {schema_name}.{table_name}.{column_name}: "
+                            f"more than {limit} distinct values"
+                        )
+                        skipped += 1
+                        continue
+
+                    column_content = _build_column_content(
+                        database, schema_name, table_name, column_name, values, options
+                    )
+                    if column_content is None:
+                        skipped += 1
+                        continue
+
+                    contents.append(column_content)
+                return contents, skipped
+
+        for column_name in column_names:
+            try:
+                column_content = _collect_column_values(
+                    conn, database, schema_name, table_name, column_name, options
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to extract values for %s.%s.%s",
+                    schema_name,
+                    table_name,
+                    column_name,
+                )
+                # Clear a failed transaction so the next column can still run
+                conn.rollback()
+                continue
+
+            if column_content is None:
+                skipped += 1
+                continue
+
+            contents.append(column_content)
+    return contents, skipped
+
+
 def _collect_column_values(
+    conn: Connection,
     database: str,
     schema_name: str,
     table_name: str,
@@ -150,26 +228,44 @@ def _collect_column_values(
     options: ExtractionOptions,
 ) -> ColumnContent | None:
     """Collect and clean distinct string values from a specific column."""
-    with connection_scope(database) as conn:
-        distinct_values = _fetch_distinct_strings(
-            conn,
-            table_name,
-            column_name,
-            schema=schema_name,
-            limit=options.max_values_per_column + 1,
+    # One extra value is enough to tell an over-limit column apart in one scan
+    distinct_values = _fetch_distinct_strings(
+        conn,
+        table_name,
+        column_name,
+        schema=schema_name,
+        limit=options.max_values_per_column + 1,
+    )
+
+    if len(distinct_values) > options.max_values_per_column:
+        logger.debug(
+            f"Skipping {schema_name}.{table_name}.{column_name}: "
+            f"more than {options.max_values_per_column} distinct values"
         )
+        return None
 
-        if len(distinct_values) > options.max_values_per_column:
-            logger.debug(
-                f"Skipping {schema_name}.{table_name}.{column_name}: "
-                f"more than {options.max_values_per_column} distinct values"
-            )
-            return None
+    return _build_column_content(
+        database, schema_name, table_name, column_name, distinct_values, options
+    )
 
+
+def _build_column_content(
+    database: str,
+    schema_name: str,
+    table_name: str,
+    column_name: str,
+    distinct_values: Sequence[Any],
+    options: ExtractionOptions,
+) -> ColumnContent | None:
+    """Clean raw distinct values into a ColumnContent, or None if nothing is left."""
+    # Bounds hoisted out of the per-value loop
+    min_length, max_length = options.min_length, options.max_length
     filtered = [
         value
-        for value in (_clean_value(raw, options) for raw in distinct_values)
-        if value is not None
+        for value in map(_normalize_value, distinct_values)
+        if value
+        and min_length <= len(value) <= max_length
+        and not _looks_numeric(value)
     ]
     if not filtered:
         return None
@@ -184,6 +280,46 @@ def _collect_column_values(
     )
 
 
+def _fetch_distinct_by_column(
+    conn: Connection,
+    table_name: str,
+    column_names: Sequence[str],
+    *,
+    schema: str,
+    limit: int,
+) -> dict[str, list[Any]]:
+    """Fetch up to `limit` distinct non-null values per column in one statement.
+
+    Each column contributes a bounded DISTINCT branch to a UNION ALL, so a table's
+    textual columns cost a single round-trip instead of one (or two) per column.
+    """
+    tbl = table(table_name, *[column(name) for name in column_names], schema=schema)
+    branches = []
+    for name in column_names:
+        col = tbl.c[name]
+        bounded = (
+            select(col.label("value"))
+            .where(col.is_not(None))
+            .distinct()
+            .limit(limit)
+            .subquery()
+        )
+        branches.append(
+            select(
+                literal(name, literal_execute=True).label("column_name"),
+                bounded.c.value,
+            )
+        )
+
+    stmt = union_all(*branches).execution_options(stream_results=True)
+
+    values_by_column: dict[str, list[Any]] = {name: [] for name in column_names}
+    with conn.execute(stmt) as result:
+        for column_name, value in result:
+            values_by_column[column_name].append(value)
+    return values_by_column
+
+
 def _fetch_distinct_strings(
     conn: Connection,
     table_name: str,
@@ -192,35 +328,34 @@ def _fetch_distinct_strings(
     schema: str,
     limit: int,
 ) -> list[Any]:
-    """Fetch distinct non-null values from a specified column up to a limit."""
+    """Fetch distinct non-null values from a specified column up to a limit.
+
+    Uses a server-side cursor where the driver supports one, so values arrive in
+    chunks of at most `limit` rows instead of being buffered up front.
+    """
     tbl = table(table_name, column(column_name), schema=schema)
     col = tbl.c[column_name]
-    stmt = select(col).where(col.is_not(None)).distinct().limit(limit)
+    stmt = (
+        select(col)
+        .where(col.is_not(None))
+        .distinct()
+        .limit(limit)
+        .execution_options(stream_results=True, max_row_buffer=limit)
+    )
 
-    result = conn.execute(stmt)
-    return list(result.scalars())
+    with conn.execute(stmt) as result:
+        return list(islice(result.scalars(), limit))
 
 
-def _clean_value(value: Any, options: ExtractionOptions) -> str | None:
-    """Clean and validate a raw column value."""
+def _normalize_value(value: Any) -> str:
+    """Decode and trim a raw column value; None and blanks become an empty string."""
     if value is None:
-        return None
-
+        return ""
     if isinstance(value, bytes):
         value = value.decode("utf-8", errors="ignore")
     elif not isinstance(value, str):
         value = str(value)
-
-    trimmed = value.strip()
-    if not trimmed:
-        return None
-    if not (options.min_length <= len(trimmed) <= options.max_length):
-        return None
-
-    if _looks_numeric(trimmed):
-        return None
-
-    return trimmed
+    return value.strip()
 
 
 def _is_textual_column(sql_type) -> bool:
@@ -230,6 +365,9 @@ def _is_textual_column(sql_type) -> bool:
 
 
 def _looks_numeric(value: str) -> bool:
+    # Cheap character-class prefilter so most text never raises inside float()
+    if not _NUMERIC_CHARS.issuperset(value):
+        return value.lower() in _NON_FINITE
     try:
         float(value)
         return True
@@ -1,11 +1,12 @@
-from dataclasses import dataclass
-from typing import Iterable, Protocol
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Protocol, Sequence
 from functools import lru_cache
 
 import numpy as np
-from scipy.sparse import coo_matrix, csr_matrix, csr_array
+from scipy.sparse import csr_matrix, csr_array
 from scipy.sparse.csgraph import (
-    shortest_path,
+    breadth_first_order,
     connected_components,
     minimum_spanning_tree,
 )
@@ -22,7 +23,7 @@ class ForeignKeyInfo(Protocol):
         """Return all table names in the database."""
         ...
 
-    def get_foreign_keys(self, table_name: str) -> list[dict]:
+    def get_foreign_keys(self, table_name: str) -> Sequence[Mapping[str, Any]]:
         """Return foreign key constraints for a table."""
         ...
 
@@ -51,7 +52,16 @@ class FKSnapshot:
     name_to_idx: dict[str, int]
     idx_to_name: list[str]
     components: np.ndarray
-    edge_constraints: dict[frozenset[str], list[ForeignKeyConstraint]]
+    # keyed by the (min, max) index pair of the two tables
+    edge_constraints: dict[tuple[int, int], list[ForeignKeyConstraint]]
+    # source index -> (distances, predecessors), filled lazily per source
+    sp_rows: dict[int, tuple[np.ndarray, np.ndarray]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # requested tables (in order) -> resolved join steps
+    joins: dict[tuple[str, ...], tuple["JoinStep", ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
 
 @lru_cache(maxsize=16)
@@ -63,17 +73,15 @@ def _build_snapshot(fk_info: ForeignKeyInfo) -> FKSnapshot:
         - CSR adjacency matrix A ∈ {0,1}^{n*n}
           where A[i,j] = 1 if a join (FK) exists between tables i and j.
         - Connected components using `connected_components(A)`.
-        - Edge constraints registry: for each {a,b}, all FK constraints.
+        - Edge constraints registry: for each (min(i,j), max(i,j)), all FK constraints.
     """
     tables = list(fk_info.get_table_names())
 
     name_to_idx = {t: i for i, t in enumerate(tables)}
     idx_to_name = tables[:]
 
-    rows: list[int] = []
-    cols: list[int] = []
-    data: list[int] = []
-    edge_constraints: dict[frozenset[str], list[ForeignKeyConstraint]] = {}
+    edge_pairs: list[tuple[int, int]] = []
+    edge_constraints: dict[tuple[int, int], list[ForeignKeyConstraint]] = {}
 
     missing_refs: set[tuple[str, str]] = set()
 
@@ -96,16 +104,19 @@ def _build_snapshot(fk_info: ForeignKeyInfo) -> FKSnapshot:
                 to_table=ref,
                 column_pairs=tuple(zip(cons, refs)),
             )
-            edge_constraints.setdefault(frozenset({t, ref}), []).append(c)
-
-            # undirected unit edge for BFS/Dijkstra
             ui, vi = name_to_idx[t], name_to_idx[ref]
-            rows.extend([ui, vi])
-            cols.extend([vi, ui])
-            data.extend([1, 1])
+            key = (ui, vi) if ui < vi else (vi, ui)
+            edge_constraints.setdefault(key, []).append(c)
+
+            edge_pairs.append((ui, vi))
 
+    # undirected unit edges for BFS/Dijkstra, assembled in one vectorized pass
     n = len(tables)
-    csr = coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    edges = np.array(edge_pairs, dtype=np.int32).reshape(-1, 2)
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0]))
+    data = np.ones(rows.size, dtype=np.int8)
+    csr = csr_array((data, (rows, cols)), shape=(n, n))
     _, comps = connected_components(csr, directed=False)
 
     if missing_refs:
@@ -122,6 +133,11 @@ def clear_cache() -> None:
     _build_snapshot.cache_clear()
 
 
+def warm_cache(fk_info: ForeignKeyInfo) -> None:
+    """Build and cache the FK snapshot ahead of the first join path query."""
+    _build_snapshot(fk_info)
+
+
 def shortest_join_path(
     fk_info: ForeignKeyInfo, left: str, right: str
 ) -> list[JoinStep]:
@@ -139,23 +155,22 @@ def shortest_join_path(
         ValueError: If no path exists or if tables are unknown.
     """
     fk_graph = _build_snapshot(fk_info)
-    _ensure_known(fk_graph, (left, right))
-    source_index, target_index = fk_graph.name_to_idx[left], fk_graph.name_to_idx[right]
+    if (cached := fk_graph.joins.get((left, right))) is not None:
+        return list(cached)
+    source_index, target_index = _ensure_known(fk_graph, (left, right))
     if fk_graph.components[source_index] != fk_graph.components[target_index]:
         raise ValueError(f"No join path between '{left}' and '{right}'.")
 
-    dist, pred = shortest_path(
-        fk_graph.csr,
-        directed=False,
-        unweighted=True,
-        indices=source_index,
-        return_predecessors=True,
-    )
-    if not np.isfinite(dist[target_index]):
+    if (row := fk_graph.sp_rows.get(source_index)) is not None:
+        path = _reconstruct_path(row[1], source_index, target_index)
+    else:
+        path = _bidirectional_path(fk_graph.csr, source_index, target_index)
+    if path is None:
         raise ValueError(f"No join path between '{left}' and '{right}'.")
 
-    path = _reconstruct_path(pred, source_index, target_index)
-    return _steps_from_path(fk_graph, path)
+    steps = _steps_from_path(fk_graph, path)
+    fk_graph.joins[(left, right)] = tuple(steps)
+    return steps
 
 
 def connect_tables(fk_info: ForeignKeyInfo, tables: Iterable[str]) -> list[JoinStep]:
@@ -178,20 +193,27 @@ def connect_tables(fk_info: ForeignKeyInfo, tables: Iterable[str]) -> list[JoinS
     if len(requested) < 2:
         raise ValueError("Provide at least two tables.")
     fk_graph = _build_snapshot(fk_info)
-    _ensure_known(fk_graph, requested)
-
-    term_idx = [fk_graph.name_to_idx[t] for t in requested]
+    key = tuple(requested)
+    if (cached := fk_graph.joins.get(key)) is not None:
+        return list(cached)
+    term_idx = _ensure_known(fk_graph, requested)
     if len(set(map(int, fk_graph.components[term_idx]))) > 1:
         raise ValueError(f"No join path connects: {', '.join(requested)}.")
 
+    # Tables already joined to each other need no intermediates: any spanning
+    # tree of the subgraph they induce is an optimal Steiner tree (k - 1 joins)
+    induced = fk_graph.csr[term_idx, :][:, term_idx]
+    if connected_components(induced, directed=False)[0] == 1:
+        rows, cols = induced.nonzero()
+        edges = {(term_idx[i], term_idx[j]) for i, j in zip(rows, cols)}
+        edges.update({(v, u) for u, v in edges})
+        ordered = _bfs_edges_from(term_idx[0], edges)
+        steps = [_edge_to_step(fk_graph, u, v) for (u, v) in ordered]
+        fk_graph.joins[key] = tuple(steps)
+        return steps
+
     # Distances from terminals
-    dists, preds = shortest_path(
-        fk_graph.csr,
-        directed=False,
-        unweighted=True,
-        indices=term_idx,
-        return_predecessors=True,
-    )
+    dists, preds = _shortest_paths_from(fk_graph, term_idx)
     k = len(term_idx)
     W = np.full((k, k), np.inf)
     for i in range(k):
@@ -214,15 +236,105 @@ def connect_tables(fk_info: ForeignKeyInfo, tables: Iterable[str]) -> list[JoinS
 
     # BFS order over steiner edges starting at first terminal
     ordered = _bfs_edges_from(term_idx[0], edges)
-    return [_edge_to_step(fk_graph, u, v) for (u, v) in ordered]
+    steps = [_edge_to_step(fk_graph, u, v) for (u, v) in ordered]
+    fk_graph.joins[key] = tuple(steps)
+    return steps
 
 
-def _ensure_known(g: FKSnapshot, names: Iterable[str]) -> None:
-    """Raise ValueError if any table names are not in the graph."""
-    missing = [t for t in names if t not in g.name_to_idx]
-    if missing:
+def _ensure_known(g: FKSnapshot, names: Sequence[str]) -> list[int]:
+    """Return the graph indices of `names`, raising ValueError if any are unknown."""
+    lookup = g.name_to_idx.get
+    indices = [lookup(t, -1) for t in names]
+    if -1 in indices:
+        missing = [t for t, i in zip(names, indices) if i == -1]
         avail = ", ".join(sorted(g.name_to_idx))
         raise ValueError(f"Unknown tables: {', '.join(missing)}. Available: {avail}.")
+    return indices
+
+
+def _shortest_paths_from(
+    g: FKSnapshot, sources: list[int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (distances, predecessors) rows for `sources`, computing each source once.
+
+    Rows are memoized on the snapshot, so repeated lookups against the same cached
+    schema skip the BFS entirely.
+    """
+    for i in dict.fromkeys(sources):
+        if i not in g.sp_rows:
+            g.sp_rows[i] = _bfs_row(g.csr, i)
+
+    rows = [g.sp_rows[i] for i in sources]
+    return np.stack([d for d, _ in rows]), np.stack([p for _, p in rows])
+
+
+def _bidirectional_path(csr: csr_array, s: int, t: int) -> list[int] | None:
+    """Shortest path between two nodes, growing BFS frontiers from both ends.
+
+    The smaller frontier is expanded one full level at a time, so the first node
+    reached by both searches lies on a shortest path.
+    """
+    if s == t:
+        return [s]
+    indptr, indices = csr.indptr, csr.indices
+    parents: tuple[dict[int, int], dict[int, int]] = ({s: -1}, {t: -1})
+    frontiers: list[list[int]] = [[s], [t]]
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        seen, other = parents[side], parents[1 - side]
+        level: list[int] = []
+        for u in frontiers[side]:
+            for v in indices[indptr[u] : indptr[u + 1]].tolist():
+                if v in seen:
+                    continue
+                seen[v] = u
+                if v in other:
+                    return _stitch_path(parents, v)
+                level.append(v)
+        frontiers[side] = level
+    return None
+
+
+def _stitch_path(
+    parents: tuple[dict[int, int], dict[int, int]], meet: int
+) -> list[int]:
+    """Join the forward and backward parent chains at `meet`."""
+    forward, backward = parents
+    path: list[int] = []
+    cur = meet
+    while cur != -1:
+        path.append(cur)
+        cur = forward[cur]
+    path.reverse()
+    cur = backward[meet]
+    while cur != -1:
+        path.append(cur)
+        cur = backward[cur]
+    return path
+
+
+def _bfs_row(csr: csr_array, source: int) -> tuple[np.ndarray, np.ndarray]:
+    """Unit-weight single-source distances and predecessors via BFS.
+
+    Every FK edge costs one join, so a plain BFS gives the same paths as Dijkstra
+    in O(V + E). Depths are derived from the predecessor tree by pointer jumping,
+    which takes O(log depth) vectorized passes.
+    """
+    order, pred = breadth_first_order(
+        csr, source, directed=False, return_predecessors=True
+    )
+    n = pred.shape[0]
+    hop = np.where(pred >= 0, pred, np.arange(n))
+    depth = (pred >= 0).astype(np.float64)
+    while True:
+        nxt = hop[hop]
+        if np.array_equal(nxt, hop):
+            break
+        depth += depth[hop]
+        hop = nxt
+    dist = np.full(n, np.inf)
+    dist[order] = depth[order]
+    return dist, pred
 
 
 def _reconstruct_path(pred_row: np.ndarray, s: int, t: int) -> list[int]:
@@ -240,7 +352,7 @@ def _reconstruct_path(pred_row: np.ndarray, s: int, t: int) -> list[int]:
 def _edge_to_step(g: FKSnapshot, u: int, v: int) -> JoinStep:
     """Convert a graph edge (u, v) to a JoinStep."""
     a, b = g.idx_to_name[u], g.idx_to_name[v]
-    cs = g.edge_constraints.get(frozenset({a, b})) or []
+    cs = g.edge_constraints.get((u, v) if u < v else (v, u)) or []
     for c in cs:
         if c.from_table == a and c.to_table == b:
             return JoinStep(a, b, c.column_pairs, c.name)
@@ -262,17 +374,18 @@ def _bfs_edges_from(
     start: int, undirected_edges: set[tuple[int, int]]
 ) -> list[tuple[int, int]]:
     """Return a BFS-ordered list of directed edges from a set of undirected edges."""
+    # Only nodes on the (small) tree get an entry, however large the schema is
     adj: dict[int, list[int]] = {}
     for u, v in undirected_edges:
         adj.setdefault(u, []).append(v)
 
     seen: set[int] = {start}
-    q: list[int] = [start]
+    q: deque[int] = deque([start])
     out: list[tuple[int, int]] = []
 
     while q:
-        u = q.pop(0)
-        for v in adj.get(u, []):
+        u = q.popleft()
+        for v in adj.get(u, ()):
             if v not in seen:
                 seen.add(v)
                 q.append(v)
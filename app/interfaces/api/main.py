@@ -5,6 +5,8 @@ from starlette.middleware.gzip import GZipMiddleware
 from starlette.types import StatelessLifespan, StatefulLifespan
 
 from app.core.config import get_settings
+from app.interfaces.api.routes.agent import router as agent_router
+from app.interfaces.api.routes.diagnostics import router as diagnostics_router
 from app.interfaces.api.routes.openbb_widgets import router as openbb_widgets_router
 
 
@@ -30,6 +32,8 @@ def create_app(
     application.add_middleware(GZipMiddleware, minimum_size=1024)
 
     application.include_router(openbb_widgets_router)
+    application.include_router(diagnostics_router)
+    application.include_router(agent_router)
 
     return application
 
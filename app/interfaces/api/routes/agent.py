@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from app.services.data_agent_service import get_caching_data_agent
+
+router = APIRouter()
+
+
+class AskRequest(BaseModel):
+    question: str = Field(..., min_length=1, description="Question for the data agent.")
+    database: str | None = Field(
+        default=None, description="Registered database alias the question is about."
+    )
+
+
+class AskResponse(BaseModel):
+    answer: str
+
+
+@router.post("/agent/ask")
+async def ask_data_agent(request: AskRequest) -> AskResponse:
+    """Answer a question with the data agent, served from the semantic cache when possible."""
+    answer = await get_caching_data_agent().run(
+        request.question, database=request.database
+    )
+    return AskResponse(answer=answer)
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from app.repositories.sql_db import get_pool_stats
+
+router = APIRouter()
+
+
+@router.get("/pools")
+def get_connection_pools() -> dict[str, dict[str, int | str]]:
+    """Report connection pool usage per registered database."""
+    return get_pool_stats()
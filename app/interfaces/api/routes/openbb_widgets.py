@@ -1,23 +1,103 @@
+import hashlib
+import threading
+import time
+from collections.abc import Iterator
+from decimal import Decimal
+from functools import cache
+from itertools import chain
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
+from app.core.config import get_settings
 from app.interfaces.api.routes.widget_registry import WIDGETS, register_widget
-from app.repositories.sql_db import connection_scope, execute_select
+from app.repositories.sql_db import connection_scope, stream_select
 
 router = APIRouter()
 
 
-def _run_query(database: str, query: str) -> list[dict[str, Any]]:
+def _stream_query(database: str, query: str) -> Iterator[bytes]:
+    """Yield the query result as a JSON array, one partition of rows at a time."""
     with connection_scope(database) as connection:
-        rows = execute_select(connection, query)
-        return [dict(row) for row in rows]
+        partitions = stream_select(connection, query)
+        yield b"["
+        separator = b""
+        for rows in partitions:
+            yield separator + b",".join(
+                orjson.dumps(dict(row), default=_json_default) for row in rows
+            )
+            separator = b","
+        yield b"]"
+
+
+# Widget refreshes repeat the same query; small results are kept briefly
+_QUERY_CACHE_MAX_ENTRIES = 256
+_QUERY_CACHE_MAX_BYTES = 1 << 20
+_query_cache: dict[tuple[str, str], tuple[float, bytes]] = {}
+_query_cache_lock = threading.Lock()
+
+
+def _cached_query_body(database: str, query: str) -> bytes | None:
+    with _query_cache_lock:
+        entry = _query_cache.get((database, query))
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            del _query_cache[(database, query)]
+            return None
+        return body
+
+
+def _stream_and_cache(
+    database: str, query: str, chunks: Iterator[bytes], ttl: int
+) -> Iterator[bytes]:
+    """Pass chunks through, caching the full body if it stays under the size cap."""
+    parts: list[bytes] | None = []
+    size = 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size > _QUERY_CACHE_MAX_BYTES:
+                parts = None
+            else:
+                parts.append(chunk)
+        yield chunk
+
+    if parts is None:
+        return
+    with _query_cache_lock:
+        if len(_query_cache) >= _QUERY_CACHE_MAX_ENTRIES:
+            _query_cache.pop(next(iter(_query_cache)))
+        _query_cache[(database, query)] = (time.monotonic() + ttl, b"".join(parts))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        # Exact digits, as the MCP tool returns them; float would round money
+        return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # Same text FastAPI's encoder produced for BLOBs, not the b'...' repr
+        return bytes(value).decode("utf-8", errors="replace")
+    return str(value)
+
+
+@cache
+def _widgets_manifest() -> tuple[bytes, str]:
+    """Serialize the widget registry once; widgets are all registered at import."""
+    body = orjson.dumps(WIDGETS)
+    return body, f'"{hashlib.sha256(body).hexdigest()}"'
 
 
 @router.get("/widgets.json")
-def get_widgets_manifest() -> dict[str, Any]:
+def get_widgets_manifest(request: Request) -> Response:
     """Expose registered widget metadata for OpenBB Workspace."""
-    return WIDGETS
+    body, etag = _widgets_manifest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 
 @register_widget(
@@ -60,10 +140,19 @@ def get_widgets_manifest() -> dict[str, Any]:
 def query_database_widget(
     database: str = Query(default=..., description="Registered database alias."),
     query: str = Query(default=..., description="Read-only SQL query to execute."),
-) -> list[dict[str, Any]]:
+) -> Response:
+    ttl = get_settings().widget_query_cache_ttl_seconds
+    if ttl and (body := _cached_query_body(database, query)) is not None:
+        return Response(body, media_type="application/json")
+
+    chunks = _stream_query(database, query)
     try:
-        rows = _run_query(database, query)
+        # Pull the first chunk eagerly so connection and query errors become a 400
+        first = next(chunks)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return rows
+    chunks = chain([first], chunks)
+    if ttl:
+        chunks = _stream_and_cache(database, query, chunks, ttl)
+    return StreamingResponse(chunks, media_type="application/json")
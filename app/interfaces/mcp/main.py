@@ -1,4 +1,7 @@
-from typing import Annotated
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Annotated, ParamSpec, TypeVar
 
 from fastmcp import FastMCP
 from starlette.middleware import Middleware
@@ -35,6 +38,19 @@ Use the provided tools to interact with the database effectively.
 """,
 )
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def run_in_thread(fn: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Run a blocking tool in a worker thread so it doesn't stall the event loop."""
+
+    @wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
 
 @mcp.tool
 def get_databases() -> list[dict[str, str | list[str]]]:
@@ -48,6 +64,7 @@ def get_databases() -> list[dict[str, str | list[str]]]:
 
 
 @mcp.tool
+@run_in_thread
 def show_tables(
     database: Annotated[str, "Name of the database to use"],
     schema: Annotated[str | None, "Optional name of the schema to use"] = None,
@@ -75,6 +92,7 @@ def show_tables(
 
 
 @mcp.tool
+@run_in_thread
 def show_views(
     database: Annotated[str, "Name of the database to use"],
     schema: Annotated[str | None, "Optional name of the schema to use"] = None,
@@ -87,6 +105,7 @@ def show_views(
 
 
 @mcp.tool
+@run_in_thread
 def describe_view(
     view_name: Annotated[str, "Name of the view to describe"],
     database: Annotated[str, "Name of the database to use"],
@@ -100,6 +119,7 @@ def describe_view(
 
 
 @mcp.tool
+@run_in_thread
 def describe_tables(
     table_names: Annotated[list[str], "Names of the tables to describe"],
     database: Annotated[str, "Name of the database to use"],
@@ -133,6 +153,7 @@ def describe_tables(
 
 
 @mcp.tool
+@run_in_thread
 def get_distinct_values(
     table_name: Annotated[str, "Name of the table to get distinct values from"],
     column_name: Annotated[str, "Name of the column to get distinct values from"],
@@ -155,6 +176,7 @@ def get_distinct_values(
 
 
 @mcp.tool
+@run_in_thread
 def find_relevant_columns_and_content(
     query: Annotated[str, "The search query to find relevant columns for"],
     database: Annotated[str, "Name of the database to use"],
@@ -176,6 +198,7 @@ def find_relevant_columns_and_content(
 
 
 @mcp.tool
+@run_in_thread
 def preview_table(
     table_name: Annotated[str, "Name of the table to preview"],
     database: Annotated[str, "Name of the database to use"],
@@ -192,6 +215,7 @@ def preview_table(
 
 
 @mcp.tool
+@run_in_thread
 def query_database(
     query: str,
     database: Annotated[str, "Name of the database to query"],
@@ -207,6 +231,7 @@ def query_database(
 
 
 @mcp.tool
+@run_in_thread
 def join_path(
     tables: Annotated[list[str], "Tables that should be connected via joins"],
     database: Annotated[str, "Name of the database to use"],
@@ -1,12 +1,19 @@
+import asyncio
 from contextlib import asynccontextmanager
 import timeit
 
 from fastapi import FastAPI
 
+from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.domain.embed import EmbeddingGenerator
+from app.domain.fk_analyzer import warm_cache as warm_fk_cache
 from app.interfaces.api.main import create_app as create_api_app
 from app.interfaces.mcp.main import create_mcp_app
+from app.repositories.fk_metadata import get_fk_info
+from app.repositories.sql_db import warm_pool
 from app.services.annotation_service import get_annotation_service
+from app.services.data_agent_service import get_caching_data_agent
 from app.services.indexing_service import IndexingService
 from app.services.startup_service import initialize_database_schemas
 
@@ -36,29 +43,13 @@ def build_application() -> FastAPI:
             )
             raise
 
-        # Create FTS indices on startup
-        try:
-            start_time = timeit.default_timer()
-            indexing_service = IndexingService()
-            await indexing_service.index_all_databases()
-            elapsed = timeit.default_timer() - start_time
-            logger.info(
-                "Content FTS indices created successfully in %.2f seconds", elapsed
-            )
-        except Exception as exc:
-            logger.exception("Failed to create content FTS indices on startup: %s", exc)
-
-        # Store table annotations on startup
-        try:
-            start_time = timeit.default_timer()
-            annotation_service = get_annotation_service()
-            await annotation_service.store_table_descriptions()
-            elapsed = timeit.default_timer() - start_time
-            logger.info(
-                "Table annotations stored successfully in %.2f seconds", elapsed
-            )
-        except Exception as exc:
-            logger.exception("Failed to store table annotations on startup: %s", exc)
+        # Warmups are independent of each other and of content indexing
+        await asyncio.gather(
+            _warm_connection_pools(),
+            _warm_join_graphs(),
+            _warm_up_embeddings(),
+            _index_then_annotate(),
+        )
 
         async with original_lifespan(app):
             async with mcp_app.lifespan(app):
@@ -69,4 +60,92 @@ def build_application() -> FastAPI:
     return application
 
 
+async def _warm_connection_pools() -> None:
+    """Open pooled database connections before the first tool call needs them."""
+    settings = get_settings()
+    registry = settings.databases
+    if not settings.warm_connection_pools or registry is None:
+        return
+    start_time = timeit.default_timer()
+    names = registry.names()
+    results = await asyncio.gather(
+        *(asyncio.to_thread(warm_pool, name) for name in names),
+        return_exceptions=True,
+    )
+    for name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Failed to warm connection pool for '%s': %s", name, result)
+    elapsed = timeit.default_timer() - start_time
+    logger.info("Database connection pools warmed in %.2f seconds", elapsed)
+
+
+async def _warm_join_graphs() -> None:
+    """Reflect foreign keys and build each database's join graph up front."""
+    registry = get_settings().databases
+    if registry is None:
+        return
+    start_time = timeit.default_timer()
+    names = registry.names()
+    results = await asyncio.gather(
+        *(asyncio.to_thread(warm_fk_cache, get_fk_info(name)) for name in names),
+        return_exceptions=True,
+    )
+    for name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning("Failed to build join graph for '%s': %s", name, result)
+    elapsed = timeit.default_timer() - start_time
+    logger.info("Foreign key join graphs built in %.2f seconds", elapsed)
+
+
+async def _create_content_indices() -> None:
+    """Create FTS indices on startup."""
+    try:
+        start_time = timeit.default_timer()
+        indexing_service = IndexingService()
+        await indexing_service.index_all_databases()
+        elapsed = timeit.default_timer() - start_time
+        logger.info("Content FTS indices created successfully in %.2f seconds", elapsed)
+    except Exception as exc:
+        logger.exception("Failed to create content FTS indices on startup: %s", exc)
+
+
+async def _index_then_annotate() -> None:
+    """Annotate tables once column contents are indexed, since prompts sample them."""
+    await _migrate_stored_vectors()
+    await _create_content_indices()
+    await _store_table_annotations()
+
+
+async def _migrate_stored_vectors() -> None:
+    """Re-embed stored annotations and cached questions if the vector config changed."""
+    try:
+        await get_annotation_service().migrate_stored_annotations()
+        await get_caching_data_agent().migrate_cache()
+    except Exception as exc:
+        logger.exception("Failed to migrate stored embeddings on startup: %s", exc)
+
+
+async def _warm_up_embeddings() -> None:
+    """Load and warm up the embedding model before the first request needs it."""
+    try:
+        start_time = timeit.default_timer()
+        await EmbeddingGenerator().warmup()
+        elapsed = timeit.default_timer() - start_time
+        logger.info("Embedding model warmed up in %.2f seconds", elapsed)
+    except Exception as exc:
+        logger.exception("Failed to warm up embedding model on startup: %s", exc)
+
+
+async def _store_table_annotations() -> None:
+    """Store table annotations on startup."""
+    try:
+        start_time = timeit.default_timer()
+        annotation_service = get_annotation_service()
+        await annotation_service.store_table_descriptions()
+        elapsed = timeit.default_timer() - start_time
+        logger.info("Table annotations stored successfully in %.2f seconds", elapsed)
+    except Exception as exc:
+        logger.exception("Failed to store table annotations on startup: %s", exc)
+
+
 app = build_application()
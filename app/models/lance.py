@@ -1,6 +1,7 @@
 from hashlib import sha256
 from typing import Optional
 
+import pyarrow as pa
 from lancedb.pydantic import LanceModel, Vector
 from pydantic import field_validator
 
@@ -8,6 +9,22 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+if settings.embedding_precision == "ubinary":
+    # Packed sign bits, compared with hamming distance
+    AnnotationVector = Vector(settings.n_dims // 8, value_type=pa.uint8())
+else:
+    AnnotationVector = Vector(settings.n_dims)
+
+
+def schema_hash(database: str, schema: str, table_name: str, metadata_json: str) -> str:
+    """SHA-256 of `database.schema.table.metadata_json`, fed piecewise to avoid copies."""
+    hasher = sha256()
+    for part in (database, schema, table_name):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b".")
+    hasher.update(metadata_json.encode("utf-8"))
+    return hasher.hexdigest()
+
 
 class TableAnnotation(LanceModel):
     """Schema for table annotations stored in LanceDB."""
@@ -16,7 +33,7 @@ class TableAnnotation(LanceModel):
     schema_name: str
     table_name: str
     description: str
-    embeddings: Optional[Vector(settings.n_dims)] = None  # type: ignore[valid-type]
+    embeddings: Optional[AnnotationVector] = None  # type: ignore[valid-type]
     metadata_json: str = ""
     schema_hash: str | None = None
 
@@ -27,8 +44,12 @@ class TableAnnotation(LanceModel):
         if v:
             return v
         data = info.data
-        hash_input = f"{data['database_name']}.{data['schema_name']}.{data['table_name']}.{data['metadata_json']}"
-        return sha256(hash_input.encode("utf-8")).hexdigest()
+        return schema_hash(
+            data["database_name"],
+            data["schema_name"],
+            data["table_name"],
+            data["metadata_json"],
+        )
 
 
 class ColumnContent(LanceModel):
@@ -57,3 +78,13 @@ class ColumnContent(LanceModel):
             f"{data['content']}"
         )
         return sha256(hash_input.encode("utf-8")).hexdigest()
+
+
+class QACacheEntry(LanceModel):
+    """Schema for cached data agent answers, keyed by database and question embedding."""
+
+    database_name: str = ""  # empty when the question was not scoped to a database
+    question: str
+    embeddings: Vector(settings.n_dims)  # type: ignore[valid-type]
+    answer: str
+    ts: float
@@ -1,57 +1,123 @@
-from hashlib import sha256
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
 
-from app.models.lance import TableAnnotation
+from async_lru import alru_cache
+from lancedb.db import AsyncTable
+from lancedb.index import BTree
+
+from app.models.lance import TableAnnotation, schema_hash
 from app.repositories.lance_db import (
+    ensure_vector_index,
+    eq_filter,
     get_lance_db_async,
-    batch_insert_async,
+    migrate_table,
     open_or_create_table_async,
+    to_arrow,
+    vector_mismatch,
 )
+from app.core.config import get_settings
 from app.core.db_registry import TableMetadata
 
+settings = get_settings()
+
+
+@alru_cache(maxsize=1)
+async def get_annotations_table_async() -> AsyncTable:
+    """Open the table_annotations table once per process."""
+    db = await get_lance_db_async()
+    return await open_or_create_table_async(db, "table_annotations", TableAnnotation)
+
+
+async def _ensure_scalar_indices(table: AsyncTable) -> None:
+    """Create the BTree indices behind the skip lookups once; later rows are scanned."""
+    existing = {index.name for index in await table.list_indices()}
+    # database_name backs schema_hashes_for, schema_hash the per-table check
+    for column in ("database_name", "schema_hash"):
+        if f"{column}_idx" not in existing:
+            await table.create_index(column, config=BTree())
+
+
+async def _ensure_indices(table: AsyncTable) -> None:
+    await _ensure_scalar_indices(table)
+    if settings.embedding_precision == "ubinary":
+        await ensure_vector_index(table, distance_type="hamming")
+    else:
+        await ensure_vector_index(
+            table, distance_type="cosine", num_sub_vectors=settings.n_dims // 8
+        )
+
 
 class AnnotationRepository:
     """Data access for TableAnnotation in LanceDB."""
 
-    def __init__(self):
-        self._db = None
-        self._table = None
-
-    async def _get_table(self):
-        """Lazy-load table connection."""
-        if self._table is None:
-            if self._db is None:
-                self._db = await get_lance_db_async()
-            self._table = await open_or_create_table_async(
-                self._db, "table_annotations", TableAnnotation
-            )
-        return self._table
+    async def _get_table(self) -> AsyncTable:
+        return await get_annotations_table_async()
 
     async def exists_by_schema_hash(self, schema_hash: str) -> bool:
         """Check if annotation exists for given schema hash."""
         table = await self._get_table()
         results = (
             await table.query()
-            .where(f"schema_hash == '{schema_hash}'")
+            .where(eq_filter(schema_hash=schema_hash))
             .limit(1)
             .to_list()
         )
         return len(results) > 0
 
+    async def schema_hashes_for(self, database: str) -> set[str]:
+        """Return the schema hashes of every stored annotation for a database."""
+        table = await self._get_table()
+        rows = (
+            await table.query()
+            .where(eq_filter(database_name=database))
+            .select(["schema_hash"])
+            .to_arrow()
+        )
+        return set(rows.column("schema_hash").to_pylist())
+
     async def save_batch(self, annotations: list[TableAnnotation]) -> None:
-        """Save multiple annotations to LanceDB."""
+        """Upsert annotations, replacing stale rows for re-annotated tables."""
         if not annotations:
             return
         table = await self._get_table()
-        await batch_insert_async(table, annotations)
+        if mismatch := vector_mismatch(await table.schema(), TableAnnotation):
+            raise RuntimeError(
+                f"Cannot save annotations: table_annotations {mismatch}. "
+                "Restart the service so stored descriptions are re-embedded."
+            )
+        await (
+            table.merge_insert(["database_name", "schema_name", "table_name"])
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(to_arrow(annotations))
+        )
+        await _ensure_indices(table)
+
+    async def migrate(
+        self, embed: Callable[[list[str]], Awaitable[Sequence[Any]]]
+    ) -> bool:
+        """Rewrite stored annotations for the current schema, re-embedding if needed."""
+        db = await get_lance_db_async()
+        rewritten = await migrate_table(
+            db,
+            "table_annotations",
+            TableAnnotation,
+            text_column="description",
+            embed=embed,
+        )
+        if rewritten:
+            get_annotations_table_async.cache_clear()
+            await _ensure_indices(await self._get_table())
+        return rewritten
 
     async def get_descriptions_by_database(
         self, database: str, schema: str | None = None
     ) -> list[dict[str, str]]:
         """Get all table descriptions for a database, optionally filtered by schema."""
         table = await self._get_table()
-        query = table.query().where(f"database_name = '{database}'")
-        if schema is not None:
-            query = query.where(f"schema_name = '{schema}'")
+        query = table.query().where(
+            eq_filter(database_name=database, schema_name=schema)
+        )
         query = query.select(["schema_name", "table_name", "description"])
         return await query.to_list()
 
@@ -60,5 +126,4 @@ class AnnotationRepository:
         database: str, schema: str, table_name: str, metadata: TableMetadata
     ) -> str:
         """Compute schema hash for checking if annotation is current."""
-        hash_input = f"{database}.{schema}.{table_name}.{metadata.model_dump_json()}"
-        return sha256(hash_input.encode("utf-8")).hexdigest()
+        return schema_hash(database, schema, table_name, metadata.metadata_json)
@@ -1,13 +1,32 @@
+from functools import lru_cache
 from typing import Literal
 
+from lancedb.table import Table
+
 from app.models.lance import ColumnContent
 from app.repositories.lance_db import (
+    eq_filter,
     get_lance_db_async,
     get_lance_db,
     batch_insert_async,
     open_or_create_table_async,
 )
 
+# Schema-scoped searches rank across all schemas first, so fetch extra candidates
+_SCHEMA_OVERFETCH = 10
+
+
+def _content_expr(max_values: int | None) -> str:
+    """SQL projection of `content`, trimmed to its first `max_values` entries."""
+    if max_values is None:
+        return "content"
+    return f"array_slice(content, 1, {int(max_values)})"
+
+
+@lru_cache(maxsize=16)
+def _open_table(table_name: str) -> Table:
+    return get_lance_db().open_table(table_name)
+
 
 class ColumnContentRepository:
     """Data access for ColumnContent in LanceDB."""
@@ -23,38 +42,49 @@ class ColumnContentRepository:
         *,
         schema: str | None = None,
         top_k: int = 5,
+        max_values: int | None = None,
     ) -> list[dict]:
-        """Full-text search on column contents (sync version for simple queries)."""
-        db = get_lance_db()
+        """Full-text search on column contents (sync version for simple queries).
 
+        `max_values` trims each row's `content` list inside LanceDB, so columns with
+        many distinct values are not converted to Python in full.
+        """
         target_schema = schema or self.schema
 
         try:
-            table = db.open_table(self.table_name)
+            table = _open_table(self.table_name)
+            # Cheaper than reopening, and still sees re-indexing from any process
+            table.checkout_latest()
         except Exception:
+            _open_table.cache_clear()
             raise ValueError(
                 f"Column contents for database '{self.database}' have not been indexed. "
                 f"Please run indexing first."
             )
 
         try:
-            search = table.search(query, query_type="fts", fts_columns=["content"])
-            if target_schema:
-                search = search.where(f"schema_name = '{target_schema}'")
+            # Prefiltering an FTS search on the list column returns no rows and a
+            # postfilter runs after the limit, so the schema is filtered here
+            limit = top_k * _SCHEMA_OVERFETCH if target_schema else top_k
             results = (
-                search.select(
-                    [
-                        "schema_name",
-                        "table_name",
-                        "column_name",
-                        "content",
-                        "num_distinct",
-                        "_score",
-                    ]
+                table.search(query, query_type="fts", fts_columns=["content"])
+                .select(
+                    {
+                        "schema_name": "schema_name",
+                        "table_name": "table_name",
+                        "column_name": "column_name",
+                        "content": _content_expr(max_values),
+                        "num_distinct": "num_distinct",
+                        "_score": "_score",
+                    }
                 )
-                .limit(top_k)
+                .limit(limit)
                 .to_list()
             )
+            if target_schema:
+                results = [
+                    row for row in results if row["schema_name"] == target_schema
+                ][:top_k]
         except Exception as e:
             if "no inverted index" in str(e).lower():
                 raise ValueError(
@@ -82,15 +112,43 @@ class ColumnContentRepository:
             ) from exc
 
         target_schema = schema or self.schema
-        query = table.query().where(f"table_name = '{table_name}'")
-        if target_schema:
-            query = query.where(f"schema_name = '{target_schema}'")
+        query = table.query().where(
+            eq_filter(table_name=table_name, schema_name=target_schema or None)
+        )
 
         if columns:
             query = query.select(columns)
 
         return await query.to_list()
 
+    async def get_all(
+        self, *, columns: list[str] | None = None, max_values: int | None = None
+    ) -> list[dict]:
+        """Get column contents for every table, in a single scan.
+
+        `max_values` trims each selected `content` list inside LanceDB.
+        """
+        db = await get_lance_db_async()
+        try:
+            table = await db.open_table(self.table_name)
+        except ValueError as exc:
+            raise ValueError(
+                f"Column contents table '{self.table_name}' does not exist."
+            ) from exc
+
+        query = table.query()
+        if self.schema:
+            query = query.where(eq_filter(schema_name=self.schema))
+        if columns:
+            query = query.select(
+                {
+                    column: _content_expr(max_values) if column == "content" else column
+                    for column in columns
+                }
+            )
+
+        return await query.to_list()
+
     async def save_batch(
         self,
         contents: list[ColumnContent],
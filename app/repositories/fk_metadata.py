@@ -1,7 +1,25 @@
+import json
 from functools import lru_cache
-from typing import Sequence
+from hashlib import sha256
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
-from app.repositories.sql_db import connection_scope, get_inspector
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.repositories.sql_db import (
+    clear_table_metadata_cache,
+    connection_scope,
+    get_inspector,
+    get_registry,
+    schema_version,
+)
+
+logger = get_logger(__name__)
+
+# Bump whenever the payload or the schema_version probes change meaning, so
+# snapshots validated by an older fingerprint are never trusted again
+_CACHE_FORMAT = 2
 
 
 class SqlForeignKeyInfo:
@@ -10,7 +28,7 @@ class SqlForeignKeyInfo:
     def __init__(self, database: str):
         self.database = database
         self._tables: list[str] | None = None
-        self._fk_by_table: dict[str, Sequence[dict]] | None = None
+        self._fk_by_table: dict[str, tuple[Mapping[str, Any], ...]] | None = None
 
     def __hash__(self) -> int:
         return hash(self.database)
@@ -26,18 +44,22 @@ class SqlForeignKeyInfo:
         # Return a shallow copy to keep internal cache immutable
         return list(self._tables or [])
 
-    def get_foreign_keys(self, table_name: str) -> list[dict]:
-        """Return foreign key constraints for a table."""
+    def get_foreign_keys(self, table_name: str) -> Sequence[Mapping[str, Any]]:
+        """Return read-only foreign key constraints for a table."""
         self._ensure_metadata_loaded()
         if not self._fk_by_table:
-            return []
-        return [fk.copy() for fk in self._fk_by_table.get(table_name, [])]
+            return ()
+        return self._fk_by_table.get(table_name, ())
 
     def refresh(self) -> None:
         """Reload FK metadata from the underlying database."""
         tables, fk_by_table = _load_metadata(self.database)
         self._tables = tables
-        self._fk_by_table = fk_by_table
+        # Frozen once here so callers can share entries without copying
+        self._fk_by_table = {
+            table: tuple(MappingProxyType(fk) for fk in fks)
+            for table, fks in fk_by_table.items()
+        }
 
     def _ensure_metadata_loaded(self) -> None:
         if self._tables is None or self._fk_by_table is None:
@@ -51,25 +73,81 @@ def get_fk_info(database: str) -> SqlForeignKeyInfo:
 
 
 def clear_cached_fk_info(database: str | None = None) -> None:
-    """Invalidate cached FK metadata adapters."""
+    """Invalidate cached FK metadata, its on-disk snapshots and table reflection."""
     if database is None:
+        clear_table_metadata_cache()
         get_fk_info.cache_clear()
+        for path in get_settings().metadata_cache_dir.glob("fk_*.json"):
+            path.unlink(missing_ok=True)
         return
 
     try:
+        clear_table_metadata_cache(database)
+        _cache_path(database).unlink(missing_ok=True)
         info = get_fk_info(database)
-    except KeyError:
+    except (KeyError, ValueError):
         return
     info.refresh()
 
 
 def _load_metadata(database: str) -> tuple[list[str], dict[str, Sequence[dict]]]:
-    """Load table names and foreign key metadata."""
+    """Load table names and foreign key metadata.
+
+    Where the dialect exposes a cheap schema version, the reflected result is kept
+    on disk and reused by later processes until that version changes.
+    """
+    path = _cache_path(database)
     with connection_scope(database) as conn:
+        version = schema_version(conn)
+        if version is not None and (cached := _read_cache(path, version)) is not None:
+            return cached
+
         insp = get_inspector(conn)
-        tables = list(insp.get_table_names())
-        fk_by_table: dict[str, Sequence[dict]] = {}
-        for table_name in tables:
-            fks = insp.get_foreign_keys(table_name) or []
-            fk_by_table[table_name] = [dict(fk) for fk in fks]
-    return tables, fk_by_table
+        fk_by_table: dict[str, Sequence[dict]] = {
+            table_name: [dict(fk) for fk in fks]
+            for (_, table_name), fks in insp.get_multi_foreign_keys().items()
+        }
+
+    if version is not None:
+        _write_cache(path, version, fk_by_table)
+    return list(fk_by_table), fk_by_table
+
+
+def _cache_path(database: str) -> Path:
+    # Keyed by URL as well, so repointing an alias never reuses stale metadata
+    url = get_registry().get(database).url
+    digest = sha256(f"{database}\0{url}".encode("utf-8")).hexdigest()[:16]
+    return get_settings().metadata_cache_dir / f"fk_{digest}.json"
+
+
+def _read_cache(
+    path: Path, version: str
+) -> tuple[list[str], dict[str, Sequence[dict]]] | None:
+    try:
+        payload = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if payload.get("format") != _CACHE_FORMAT or payload.get("version") != version:
+        return None
+    fk_by_table = payload["foreign_keys"]
+    return list(fk_by_table), fk_by_table
+
+
+def _write_cache(
+    path: Path, version: str, fk_by_table: dict[str, Sequence[dict]]
+) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {
+                    "format": _CACHE_FORMAT,
+                    "version": version,
+                    "foreign_keys": fk_by_table,
+                }
+            )
+        )
+        tmp.replace(path)
+    except (OSError, TypeError) as exc:
+        logger.warning("Could not persist FK metadata to %s: %s", path, exc)
@@ -1,16 +1,22 @@
+import math
 from pathlib import Path
-from typing import TypeVar, Literal
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar, Literal
 from functools import cache
 from async_lru import alru_cache
 
 import lancedb
+import pyarrow as pa
 from lancedb import DBConnection, AsyncConnection
 from lancedb.pydantic import LanceModel
 from lancedb.db import Table, AsyncTable
+from lancedb.index import IvfFlat, IvfPq
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
 
 settings = get_settings()
+logger = get_logger(__name__)
 
 T = TypeVar("T", bound=LanceModel)
 
@@ -31,34 +37,62 @@ async def get_lance_db_async() -> AsyncConnection:
     return await lancedb.connect_async(db_path)
 
 
+def eq_filter(**conditions: str | None) -> str:
+    """Build a single AND-ed equality predicate, skipping None values.
+
+    LanceDB keeps only the last `where()` of a query, so conditions must be
+    combined into one filter. Values are quoted with embedded quotes doubled.
+    """
+    return " AND ".join(
+        f"{column} = {_quote(value)}"
+        for column, value in conditions.items()
+        if value is not None
+    )
+
+
+def _quote(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
 def batch_insert(
     table: Table,
     records: list[T] | T,
     *,
-    batch_size: int = 1000,
     mode: Literal["overwrite", "append"] = "append",
 ):
-    """Insert records into a LanceDB table."""
-    if isinstance(records, list):
-        for i in range(0, len(records), batch_size):
-            table.add(records[i : i + batch_size], mode=mode)
-    else:
-        table.add(records, mode=mode)
+    """Insert records into a LanceDB table in a single commit."""
+    table.add(to_arrow(records), mode=mode)
 
 
 async def batch_insert_async(
     table: AsyncTable,
     records: list[T] | T,
     *,
-    batch_size: int = 1000,
     mode: Literal["overwrite", "append"] = "append",
 ):
-    """Asynchronously insert records into a LanceDB table."""
-    if isinstance(records, list):
-        for i in range(0, len(records), batch_size):
-            await table.add(records[i : i + batch_size], mode=mode)
-    else:
-        await table.add(records, mode=mode)
+    """Asynchronously insert records into a LanceDB table in a single commit."""
+    await table.add(to_arrow(records), mode=mode)
+
+
+def to_arrow(records: list[T] | T) -> pa.Table:
+    """Convert models to one Arrow table, so a write is one add() and one version.
+
+    Chunked adds would also make mode="overwrite" keep only the last chunk.
+    """
+    if not isinstance(records, list):
+        records = [records]
+    if not records:
+        raise ValueError("No records to insert")
+    # Column by column straight from the attributes, skipping a model_dump() per row
+    schema = type(records[0]).to_arrow_schema()
+    return pa.Table.from_arrays(
+        [
+            pa.array([getattr(record, field.name) for record in records], field.type)
+            for field in schema
+        ],
+        schema=schema,
+    )
 
 
 def open_or_create_table(
@@ -91,3 +125,103 @@ async def open_or_create_table_async(
         raise ValueError(f"Table '{table_name}' does not exist and no schema provided")
 
     return await db.create_table(table_name, schema=schema)
+
+
+def vector_mismatch(stored: pa.Schema, model: type[LanceModel]) -> str | None:
+    """Describe how a stored vector column differs from the model, if it does.
+
+    Happens after changing `n_dims` or `embedding_precision`; such rows can be
+    neither written to nor searched until they are re-embedded.
+    """
+    for field in model.to_arrow_schema():
+        if not pa.types.is_fixed_size_list(field.type):
+            continue
+        index = stored.get_field_index(field.name)
+        stored_type = stored.field(index).type if index >= 0 else None
+        if stored_type != field.type:
+            return (
+                f"column '{field.name}' is {stored_type} but {field.type} is configured"
+            )
+    return None
+
+
+async def migrate_table(
+    db: AsyncConnection,
+    table_name: str,
+    model: type[T],
+    *,
+    text_column: str,
+    embed: Callable[[list[str]], Awaitable[Sequence[Any]]],
+    vector_column: str = "embeddings",
+) -> bool:
+    """Rewrite a stored table whose schema no longer matches `model`, keeping its rows.
+
+    Rows are rebuilt through the model, so added fields take their defaults, and
+    a changed vector column is re-embedded from `text_column`. The rewrite is a
+    single overwrite, so the previous version stays restorable. Returns whether
+    the table was rewritten.
+    """
+    if table_name not in await db.table_names():
+        return False
+    table = await db.open_table(table_name)
+    stored = await table.schema()
+    expected = model.to_arrow_schema()
+    stored_types = {field.name: field.type for field in stored}
+    if stored_types == {field.name: field.type for field in expected}:
+        return False
+
+    mismatch = vector_mismatch(stored, model)
+    columns = [
+        name
+        for name in expected.names
+        if name in stored_types and not (mismatch and name == vector_column)
+    ]
+    rows = (await table.query().select(columns).to_arrow()).to_pylist()
+    logger.warning(
+        "LanceDB table '%s' no longer matches %s (%s); rewriting %d rows.",
+        table_name,
+        model.__name__,
+        mismatch or "fields changed",
+        len(rows),
+    )
+    if mismatch and rows:
+        vectors = await embed([row[text_column] for row in rows])
+        for row, vector in zip(rows, vectors, strict=True):
+            row[vector_column] = vector
+
+    data = to_arrow([model(**row) for row in rows]) if rows else None
+    await db.create_table(table_name, data=data, schema=expected, mode="overwrite")
+    return True
+
+
+async def ensure_vector_index(
+    table: AsyncTable,
+    column: str = "embeddings",
+    *,
+    distance_type: Literal["l2", "cosine", "dot", "hamming"] = "cosine",
+    num_sub_vectors: int | None = None,
+) -> None:
+    """Build an IVF vector index on `column` once the table outgrows brute-force kNN.
+
+    Uses IVF_PQ for float vectors and IVF_FLAT for hamming (binary) vectors, with
+    sqrt(num_rows) partitions. Rows added after the index exists are still found
+    through a flat scan of the unindexed fragment.
+    """
+    indices = await table.list_indices()
+    if any(index.name == f"{column}_idx" for index in indices):
+        return
+
+    num_rows = await table.count_rows()
+    if num_rows < settings.vector_index_min_rows:
+        return
+
+    num_partitions = int(math.sqrt(num_rows))
+    if distance_type == "hamming":
+        config = IvfFlat(distance_type="hamming", num_partitions=num_partitions)
+    else:
+        config = IvfPq(
+            distance_type=distance_type,
+            num_partitions=num_partitions,
+            num_sub_vectors=num_sub_vectors,
+        )
+    await table.create_index(column, config=config)
@@ -0,0 +1,92 @@
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+from app.core.logging import get_logger
+from app.models.lance import QACacheEntry
+from app.repositories.lance_db import (
+    get_lance_db_async,
+    batch_insert_async,
+    ensure_vector_index,
+    eq_filter,
+    migrate_table,
+    open_or_create_table_async,
+    vector_mismatch,
+)
+
+logger = get_logger(__name__)
+
+
+class QACacheRepository:
+    """Data access for QACacheEntry in LanceDB."""
+
+    def __init__(self):
+        self._db = None
+        self._table = None
+
+    async def _get_table(self):
+        """Lazy-load table connection; None while its vectors await re-embedding."""
+        if self._table is None:
+            if self._db is None:
+                self._db = await get_lance_db_async()
+            table = await open_or_create_table_async(self._db, "qa_cache", QACacheEntry)
+            stored = await table.schema()
+            missing = set(QACacheEntry.to_arrow_schema().names) - set(stored.names)
+            if mismatch := vector_mismatch(stored, QACacheEntry) or (
+                missing and f"lacks columns {sorted(missing)}"
+            ):
+                logger.warning("Semantic cache disabled: qa_cache %s.", mismatch)
+                return None
+            self._table = table
+        return self._table
+
+    async def find_answer(
+        self,
+        embedding: np.ndarray,
+        *,
+        database: str,
+        max_distance: float,
+        min_ts: float,
+    ) -> str | None:
+        """Return the answer of the closest cached question about `database`."""
+        table = await self._get_table()
+        if table is None:
+            return None
+        results = (
+            await table.vector_search(embedding)
+            .column("embeddings")
+            .distance_type("cosine")
+            .minimum_nprobes(10)
+            .maximum_nprobes(50)
+            .distance_range(0.0, max_distance)
+            .where(f"{eq_filter(database_name=database)} AND ts > {min_ts}")
+            .select(["answer", "_distance"])
+            .limit(1)
+            .to_list()
+        )
+        if not results:
+            return None
+        return results[0]["answer"]
+
+    async def save(self, entry: QACacheEntry, *, expire_before: float) -> None:
+        """Save a question/answer pair, dropping entries older than `expire_before`."""
+        table = await self._get_table()
+        if table is None:
+            return
+        await batch_insert_async(table, [entry])
+        await table.delete(f"ts <= {expire_before}")
+        await ensure_vector_index(table, distance_type="cosine")
+
+    async def migrate(
+        self, embed: Callable[[list[str]], Awaitable[Sequence[Any]]]
+    ) -> bool:
+        """Rewrite cached entries for the current schema, re-embedding if needed."""
+        if self._db is None:
+            self._db = await get_lance_db_async()
+        rewritten = await migrate_table(
+            self._db, "qa_cache", QACacheEntry, text_column="question", embed=embed
+        )
+        if rewritten:
+            self._table = None
+        return rewritten
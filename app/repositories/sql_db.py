@@ -1,14 +1,37 @@
-from collections.abc import Generator, Sequence
-from contextlib import contextmanager
-from functools import cache
-
-from sqlalchemy import column, create_engine, event, inspect, select, table, text
-from sqlalchemy.engine import Connection, Engine, Inspector, RowMapping
+import re
+import time
+from collections.abc import Generator, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from functools import cache, lru_cache
+
+from sqlalchemy import (
+    TextClause,
+    column,
+    create_engine,
+    event,
+    func,
+    inspect,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.engine import (
+    Connection,
+    Engine,
+    Inspector,
+    ObjectKind,
+    RowMapping,
+    make_url,
+)
 from sqlalchemy.exc import NoSuchTableError, ProgrammingError, StatementError
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import get_settings
+from app.core.logging import get_logger
 from app.core.db_registry import DatabaseRegistry, DatabaseConfig, TableMetadata
 
+logger = get_logger(__name__)
+
 
 def get_registry() -> DatabaseRegistry:
     registry = get_settings().databases
@@ -17,30 +40,79 @@ def get_registry() -> DatabaseRegistry:
     return registry
 
 
+_EMBEDDED_BACKENDS = frozenset({"sqlite", "duckdb"})
+
+_ALLOWED_COMMANDS: tuple[str, ...] = tuple(get_settings().allowed_sql_commands)
+_ALLOWED_RE = re.compile(
+    r"\s*(?:" + "|".join(map(re.escape, _ALLOWED_COMMANDS)) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def _enforce_read_only(conn, cursor, statement, parameters, context, executemany):
+    """Enforce read-only access by blocking non-SELECT statements."""
+    if not _ALLOWED_RE.match(statement):
+        raise StatementError(
+            "The operation is not allowed. only the following SQL commands are permitted: "
+            + ", ".join(_ALLOWED_COMMANDS),
+            statement,
+            parameters,
+            orig=None,
+        )
+
+
 @cache
 def get_engine(database: str) -> Engine:
     registry = get_registry()
     config: DatabaseConfig = registry.get(database)
-    engine = create_engine(config.url, pool_pre_ping=True)
-
-    settings = get_settings()
-    allowed_commands = settings.allowed_sql_commands
-
-    @event.listens_for(engine, "before_cursor_execute")
-    def enforce_read_only(conn, cursor, statement, parameters, context, executemany):
-        """Enforce read-only access by blocking non-SELECT statements."""
-        normalized = statement.strip().upper()
+    embedded = make_url(config.url).get_backend_name() in _EMBEDDED_BACKENDS
+    pre_ping = not embedded if config.pool_pre_ping is None else config.pool_pre_ping
+    if embedded:
+        # In-process engines: keep SQLAlchemy's dialect-specific default pool
+        engine = create_engine(config.url, pool_pre_ping=pre_ping)
+    else:
+        engine = create_engine(
+            config.url,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_recycle=config.pool_recycle,
+            # Reuse the most recent connection so idle extras can time out server-side
+            pool_use_lifo=True,
+            pool_pre_ping=pre_ping,
+        )
+
+    event.listen(engine, "before_cursor_execute", _enforce_read_only)
+    return engine
 
-        if not any(normalized.startswith(keyword) for keyword in allowed_commands):
-            raise StatementError(
-                "The operation is not allowed. only the following SQL commands are permitted: "
-                + ", ".join(allowed_commands),
-                statement,
-                parameters,
-                orig=None,
-            )
 
-    return engine
+def warm_pool(database: str) -> int:
+    """Check out the engine's pooled connections once and return how many were opened."""
+    engine = get_engine(database)
+    size = engine.pool.size() if isinstance(engine.pool, QueuePool) else 1
+    ping = _text_clause("SELECT 1")
+    # Hold them all at once so the pool has to open distinct connections
+    with ExitStack() as stack:
+        for _ in range(size):
+            conn = stack.enter_context(engine.connect())
+            conn.execute(ping)
+    return size
+
+
+def get_pool_stats() -> dict[str, dict[str, int | str]]:
+    """Connection pool usage for every registered database."""
+    stats: dict[str, dict[str, int | str]] = {}
+    for name in get_registry().names():
+        pool = get_engine(name).pool
+        if isinstance(pool, QueuePool):
+            stats[name] = {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        else:
+            stats[name] = {"status": pool.status()}
+    return stats
 
 
 @contextmanager
@@ -49,11 +121,22 @@ def connection_scope(
 ) -> Generator[Connection, None, None]:
     target_engine = engine or get_engine(database)
     with target_engine.connect() as conn:
-        yield conn
+        try:
+            yield conn
+        finally:
+            # The inspector holds its connection, so the entry must go explicitly
+            _inspectors.pop(conn, None)
+
+
+_inspectors: dict[Connection, Inspector] = {}
 
 
 def get_inspector(conn: Connection) -> Inspector:
-    return inspect(conn)
+    """Return the inspector for a connection, reusing it within its connection scope."""
+    inspector = _inspectors.get(conn)
+    if inspector is None:
+        inspector = _inspectors[conn] = inspect(conn)
+    return inspector
 
 
 def list_schemas(conn: Connection) -> list[str]:
@@ -68,21 +151,174 @@ def list_views(conn: Connection, schema: str | None = None) -> list[str]:
     return get_inspector(conn).get_view_names(schema=schema)
 
 
+# Binary payloads that add nothing to a short preview
+_PREVIEW_SKIP_TYPES = frozenset(
+    {
+        "BLOB",
+        "BINARY",
+        "VARBINARY",
+        "BYTEA",
+        "RAW",
+        "LONGVARBINARY",
+        "LONGBLOB",
+        "MEDIUMBLOB",
+        "IMAGE",
+    }
+)
+
+# Cheap catalog probes that change whenever tables or constraints do
+_SCHEMA_VERSION_QUERIES = {
+    "sqlite": "PRAGMA schema_version",
+    # Renames and column changes rewrite pg_class/pg_attribute rows, so their
+    # newest xmin moves even when no object is created or dropped
+    "postgresql": (
+        "SELECT (SELECT count(*) FROM pg_class)::text || ':' ||"
+        " (SELECT max(oid)::bigint FROM pg_class)::text || ':' ||"
+        " (SELECT max(xmin::text::bigint) FROM pg_class)::text || ':' ||"
+        " (SELECT max(xmin::text::bigint) FROM pg_attribute)::text || ':' ||"
+        " (SELECT count(*) FROM pg_constraint WHERE contype = 'f')::text || ':' ||"
+        " coalesce((SELECT max(oid)::bigint FROM pg_constraint)::text, '') || ':' ||"
+        " coalesce((SELECT max(xmin::text::bigint) FROM pg_constraint)::text, '')"
+    ),
+}
+
+# Per-table reflection, tagged with the schema version it was read under
+_metadata_cache: dict[tuple[Engine, str | None, str], tuple[str, TableMetadata]] = {}
+# Latest probe result per engine, reused for `schema_probe_ttl_seconds`
+_probed_versions: dict[Engine, tuple[float, str | None]] = {}
+
+
+def schema_version(conn: Connection) -> str | None:
+    """Return a cheap catalog fingerprint, or None if the dialect has no probe."""
+    query = _SCHEMA_VERSION_QUERIES.get(conn.dialect.name)
+    if query is None:
+        return None
+    try:
+        return str(conn.execute(text(query)).scalar())
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Schema version probe failed: %s", exc)
+        conn.rollback()
+        return None
+
+
+def _current_schema_version(conn: Connection) -> str | None:
+    """`schema_version`, probed at most once per engine every few seconds."""
+    if conn.dialect.name not in _SCHEMA_VERSION_QUERIES:
+        return None
+    now = time.monotonic()
+    probed = _probed_versions.get(conn.engine)
+    if probed is not None and now - probed[0] < get_settings().schema_probe_ttl_seconds:
+        return probed[1]
+    version = schema_version(conn)
+    _probed_versions[conn.engine] = (now, version)
+    return version
+
+
 def get_table_metadata(
     conn: Connection, table_name: str, schema: str | None = None
 ) -> TableMetadata:
+    """Get table metadata, reused while the schema version is unchanged.
+
+    Dialects without a version probe are reflected on every call, so DDL is
+    never hidden behind a stale entry.
+    """
+    version = _current_schema_version(conn)
+    key = (conn.engine, schema, table_name)
+    if version is not None:
+        cached = _metadata_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
     inspector = get_inspector(conn)
     if not inspector.has_table(table_name, schema=schema):
         raise ValueError(f'Table "{table_name}" does not exist.')
-    raw_metadata = {
-        "columns": inspector.get_columns(table_name, schema=schema),
-        "primary_keys": inspector.get_pk_constraint(table_name, schema=schema),
-        "foreign_keys": inspector.get_foreign_keys(table_name, schema=schema),
-        "indexes": inspector.get_indexes(table_name, schema=schema),
+    metadata = TableMetadata.from_sqlalchemy(
+        {
+            "columns": inspector.get_columns(table_name, schema=schema),
+            "primary_keys": inspector.get_pk_constraint(table_name, schema=schema),
+            "foreign_keys": inspector.get_foreign_keys(table_name, schema=schema),
+            "indexes": inspector.get_indexes(table_name, schema=schema),
+        }
+    )
+    if version is not None:
+        _metadata_cache[key] = (version, metadata)
+    return metadata
+
+
+def get_schema_metadata(
+    conn: Connection, schema: str | None = None
+) -> dict[str, TableMetadata]:
+    """Get metadata for every table and view of a schema with the bulk inspector API.
+
+    Where the schema version is known, the result also seeds the per-table cache.
+    """
+    version = _current_schema_version(conn)
+    inspector = get_inspector(conn)
+    columns = inspector.get_multi_columns(schema=schema, kind=ObjectKind.ANY)
+    primary_keys = inspector.get_multi_pk_constraint(schema=schema, kind=ObjectKind.ANY)
+    foreign_keys = inspector.get_multi_foreign_keys(schema=schema, kind=ObjectKind.ANY)
+    indexes = inspector.get_multi_indexes(schema=schema, kind=ObjectKind.ANY)
+
+    reflected = {
+        object_key[1]: TableMetadata.from_sqlalchemy(
+            {
+                "columns": table_columns,
+                "primary_keys": primary_keys.get(object_key, {}),
+                "foreign_keys": foreign_keys.get(object_key, []),
+                "indexes": indexes.get(object_key, []),
+            }
+        )
+        for object_key, table_columns in columns.items()
+    }
+    if version is not None:
+        _metadata_cache.update(
+            ((conn.engine, schema, name), (version, metadata))
+            for name, metadata in reflected.items()
+        )
+    return reflected
+
+
+def clear_table_metadata_cache(database: str | None = None) -> None:
+    """Drop cached table reflection so the next lookup re-reads the catalog."""
+    if database is None:
+        _metadata_cache.clear()
+        _probed_versions.clear()
+        return
+    engine = get_engine(database)
+    _probed_versions.pop(engine, None)
+    for key in [key for key in _metadata_cache if key[0] is engine]:
+        del _metadata_cache[key]
+
+
+# Character types whose preview values can be truncated by the database
+_PREVIEW_TEXT_TYPES = frozenset(
+    {
+        "TEXT",
+        "VARCHAR",
+        "CHAR",
+        "NVARCHAR",
+        "NCHAR",
+        "CHARACTER",
+        "CHARACTER VARYING",
+        "VARCHAR2",
+        "NVARCHAR2",
+        "CLOB",
+        "NCLOB",
+        "STRING",
+        "CITEXT",
+        "TINYTEXT",
+        "MEDIUMTEXT",
+        "LONGTEXT",
     }
+)
+# Dialects that spell substring as SUBSTR(value, start, length)
+_SUBSTR_DIALECTS = frozenset(
+    {"sqlite", "postgresql", "mysql", "mariadb", "duckdb", "oracle"}
+)
 
-    metadata = TableMetadata.from_sqlalchemy(raw_metadata)
-    return metadata
+
+def _base_type(type_name: str) -> str:
+    return type_name.split("(", 1)[0].strip().upper()
 
 
 def get_table_preview(
@@ -93,26 +329,13 @@ def get_table_preview(
     max_field_length: int = 150,
 ) -> list[dict]:
     """Get a preview of table data"""
-    inspector = get_inspector(conn)
-    try:
-        columns = inspector.get_columns(table_name, schema=schema)
-    except NoSuchTableError as exc:
-        raise ValueError(f'Table "{table_name}" does not exist.') from exc
+    columns = get_table_metadata(conn, table_name, schema=schema).columns
 
     if not columns:
         return []
 
-    skip_types = {
-        "BLOB",
-        "BINARY",
-        "VARBINARY",
-        "BYTEA",
-        "RAW",
-        "LONGVARBINARY",
-        "IMAGE",
-    }
     preview_columns = [
-        col for col in columns if str(col["type"]).upper() not in skip_types
+        col for col in columns if _base_type(col["type"]) not in _PREVIEW_SKIP_TYPES
     ]
 
     if not preview_columns:
@@ -121,13 +344,28 @@ def get_table_preview(
     tbl = table(
         table_name, *[column(col["name"]) for col in preview_columns], schema=schema
     )
-
-    stmt = select(tbl).limit(limit)
+    selected = list(tbl.c)
+    if conn.dialect.name in _SUBSTR_DIALECTS:
+        # Let the database cut long text; one extra char still marks it as truncated
+        selected = [
+            func.substr(c, 1, max_field_length + 1).label(c.name)
+            if _base_type(col["type"]) in _PREVIEW_TEXT_TYPES
+            else c
+            for c, col in zip(tbl.c, preview_columns)
+        ]
+
+    stmt = (
+        select(*selected)
+        .limit(limit)
+        .execution_options(stream_results=True, max_row_buffer=limit)
+    )
     try:
         result = conn.execute(stmt)
     except ProgrammingError as exc:
         raise ValueError(f'Failed to preview table "{table_name}": {exc.orig}') from exc
-    rows = result.mappings().all()
+    # Closing releases the server-side cursor instead of leaving it to GC
+    with result:
+        rows = result.mappings().fetchmany(limit)
 
     return [
         {key: _truncate_value(value, max_field_length) for key, value in row.items()}
@@ -179,11 +417,36 @@ def get_fk_graph(
 def execute_select(
     conn: Connection, query: str, limit: int | None = None
 ) -> Sequence[RowMapping]:
-    result = conn.execute(text(query))
-    mappings = result.mappings()
-    if limit is not None:
-        return mappings.fetchmany(limit)
-    return mappings.all()
+    if limit is None:
+        return conn.execute(_text_clause(query)).mappings().all()
+    # Server-side cursor so drivers don't buffer rows beyond the limit
+    result = conn.execute(
+        _text_clause(query),
+        execution_options={"stream_results": True, "max_row_buffer": limit},
+    )
+    with result:
+        return result.mappings().fetchmany(limit)
+
+
+def stream_select(
+    conn: Connection, query: str, chunk_size: int = 10_000
+) -> Iterator[Sequence[RowMapping]]:
+    """Execute a query and return its rows in partitions of `chunk_size`.
+
+    The statement runs immediately (so errors surface here), then rows are pulled
+    through a server-side cursor, keeping memory at O(chunk_size).
+    """
+    result = conn.execute(
+        _text_clause(query),
+        execution_options={"stream_results": True, "max_row_buffer": chunk_size},
+    )
+    return result.mappings().partitions(chunk_size)
+
+
+@lru_cache(maxsize=1024)
+def _text_clause(query: str) -> TextClause:
+    """Parse raw SQL once; repeated queries reuse the clause and its compiled form."""
+    return text(query)
 
 
 def list_databases() -> list[dict[str, str | list[str]]]:
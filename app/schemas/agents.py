@@ -23,12 +23,39 @@ class BaseDescription(BaseModel):
 
 
 class TableDescription(BaseDescription):
+    description: str = Field(
+        ...,
+        description=(
+            "Plain-text paragraph of at most 100 words summarizing the table's contents"
+            " and potential uses. Spell out meanings inferred from distinct values,"
+            " e.g. if Class holds 'L' and the table describes product quality,"
+            " Class = 'L' likely means low quality."
+        ),
+    )
     max_words: int = 100
 
 
+class BatchTableDescription(TableDescription):
+    table_name: str = Field(
+        ...,
+        description="The section's name attribute, 'schema.table', copied exactly.",
+    )
+
+
+class TableDescriptionBatch(BaseModel):
+    """Descriptions for a batch of tables, each tagged with the table it describes."""
+
+    tables: list[BatchTableDescription] = Field(
+        ..., description="One description per table, in section order."
+    )
+
+
 class DatabaseDescription(BaseDescription):
     description: str = Field(
         ...,
-        description="A brief but detailed summary of a database's contents and potential uses.",
+        description=(
+            "Plain-text paragraph of at most 200 words summarizing the database's"
+            " contents and potential uses."
+        ),
     )
     max_words: int = 200
@@ -30,3 +30,24 @@ class DatabaseConfig(BaseModel):
             "discovered at startup will be used."
         ),
     )
+    pool_size: int = Field(
+        default=10,
+        ge=1,
+        description="Persistent connections kept by the pool (network databases only).",
+    )
+    max_overflow: int = Field(
+        default=20,
+        ge=0,
+        description="Extra connections allowed beyond pool_size under load.",
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced; -1 disables.",
+    )
+    pool_pre_ping: bool | None = Field(
+        default=None,
+        description=(
+            "Test connections for liveness on checkout. Defaults to on for network "
+            "databases and off for embedded engines (SQLite, DuckDB)."
+        ),
+    )
@@ -1,20 +1,30 @@
 import asyncio
-from functools import lru_cache
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import TypedDict
 
-from app.agents.annotation_agents import table_annotation_agent
+from lancedb.table import Table
+
+from app.agents.annotation_agents import (
+    batch_table_annotation_agent,
+    table_annotation_agent,
+)
 from app.repositories.sql_db import (
     connection_scope,
     list_tables,
+    get_schema_metadata,
     get_table_metadata,
     get_table_preview,
     list_schemas_for,
 )
 from app.repositories.annotations import AnnotationRepository
 from app.repositories.column_contents import ColumnContentRepository
-from app.repositories.lance_db import get_lance_db, open_or_create_table
+from app.repositories.lance_db import eq_filter, get_lance_db, open_or_create_table
 from app.models.lance import TableAnnotation
 from app.schemas.agents import TableDescription as TableDescriptionModel
+from app.schemas.agents import TableDescriptionBatch
+from app.core.db_registry import TableMetadata
 from app.domain.embed import EmbeddingGenerator
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -22,6 +32,9 @@ from app.core.logging import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Upper bound per LanceDB write; also the capacity of the queue feeding the writer
+_SAVE_CHUNK_SIZE = 128
+
 
 class TableDescription(TypedDict):
     """Type for table description dictionary."""
@@ -31,6 +44,22 @@ class TableDescription(TypedDict):
     description: str | None
 
 
+# Formatted column samples keyed by (schema, table)
+_ColumnSamples = dict[tuple[str, str], list[str]]
+
+
+@dataclass(frozen=True)
+class _TableContext:
+    """Inputs gathered for describing a single table."""
+
+    schema: str
+    table_name: str
+    metadata: TableMetadata
+    preview: list[dict]
+    column_samples: list[str]
+    schema_hash: str | None
+
+
 class AnnotationService:
     """Service for generating and storing table annotations."""
 
@@ -52,56 +81,14 @@ class AnnotationService:
     ) -> TableAnnotation | None:
         """Generate annotation for a table using the annotation agent."""
         try:
-            with connection_scope(database) as conn:
-                metadata = get_table_metadata(conn, table_name, schema=schema)
-                preview = get_table_preview(conn, table_name, schema=schema, limit=5)
-
-            logger.debug(
-                "Annotating table '%s' (schema '%s') in database '%s'.",
-                table_name,
-                schema,
-                database,
-            )
-
-            # Check if already exists
-            schema_hash: str | None = None
-            if skip_if_exists:
-                schema_hash = self.annotation_repo.compute_schema_hash(
-                    database, schema, table_name, metadata
-                )
-                if await self.annotation_repo.exists_by_schema_hash(schema_hash):
-                    logger.debug(
-                        (
-                            "Annotation for table '%s' (schema '%s') in database '%s'"
-                            " is up-to-date, skipping."
-                        ),
-                        table_name,
-                        schema,
-                        database,
-                    )
-                    return None
-
-            # Get column content samples
-            column_repo = ColumnContentRepository(database, schema=schema)
-            column_samples = await self._get_column_samples(
-                column_repo, table_name, schema
+            context = await self._prepare_table(
+                database, schema, table_name, skip_if_exists=skip_if_exists
             )
+            if context is None:
+                return None
 
-            description = await self._generate_description(
-                database, schema, table_name, metadata, preview, column_samples
-            )
-
-            annotation = TableAnnotation(
-                database_name=database,
-                schema_name=schema,
-                table_name=table_name,
-                description=description,
-                metadata_json=metadata.model_dump_json(),
-                embeddings=None,  # to be filled later
-                schema_hash=schema_hash,
-            )
-
-            return annotation
+            description = await self._generate_description(database, context)
+            return self._to_annotation(database, context, description)
         except Exception as exc:
             logger.error(
                 "Failed to annotate table '%s' (schema '%s') in database '%s': %s",
@@ -119,15 +106,20 @@ class AnnotationService:
         *,
         skip_if_exists: bool = False,
         max_concurrent: int | None = None,
-    ) -> list[TableAnnotation]:
-        """Annotate all tables in a given database with controlled concurrency."""
+        batch_size: int | None = None,
+    ) -> AsyncIterator[TableAnnotation]:
+        """Annotate all tables in a given database with controlled concurrency.
+
+        Tables are described `batch_size` at a time in a single LLM call,
+        falling back to one call per table if a batch cannot be parsed.
+        Annotations are yielded as soon as their batch finishes.
+        """
         schemas = tuple(list_schemas_for(database))
 
-        table_targets: list[tuple[str, str]] = []
-        with connection_scope(database) as conn:
-            for schema in schemas:
-                names = list_tables(conn, schema=schema)
-                table_targets.extend((schema, name) for name in names)
+        # Reflected up front so up-to-date tables are skipped without a round-trip
+        table_targets, metadata_by_target = await asyncio.to_thread(
+            _discover_tables, database, schemas
+        )
 
         logger.info(
             "Annotating %d tables across %d schemas in database '%s'.",
@@ -139,39 +131,118 @@ class AnnotationService:
         # Prevent "too many open files"
         if max_concurrent is None:
             max_concurrent = settings.max_concurrent_annotations
+        if batch_size is None:
+            batch_size = settings.annotation_batch_size
 
         logger.debug(
-            "Using max_concurrent_annotations=%d for database '%s'",
+            "Using max_concurrent_annotations=%d, annotation_batch_size=%d for database '%s'",
             max_concurrent,
+            batch_size,
             database,
         )
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def annotate_with_limit(schema: str, table_name: str):
+        # One read of the stored hashes instead of a lookup per table
+        known_hashes = (
+            await self.annotation_repo.schema_hashes_for(database)
+            if skip_if_exists
+            else None
+        )
+
+        samples_task: asyncio.Task[_ColumnSamples] | None = None
+
+        def column_samples() -> asyncio.Task[_ColumnSamples]:
+            # One scan of the database's column contents, started by the first
+            # table that actually needs describing
+            nonlocal samples_task
+            if samples_task is None:
+                samples_task = asyncio.create_task(
+                    self._get_database_column_samples(database)
+                )
+            return samples_task
+
+        async def prepare_with_limit(schema: str, table_name: str):
             async with semaphore:
-                return await self.annotate_table(
+                try:
+                    return await self._prepare_table(
+                        database,
+                        schema,
+                        table_name,
+                        skip_if_exists=skip_if_exists,
+                        metadata=metadata_by_target.get((schema, table_name)),
+                        known_hashes=known_hashes,
+                        column_samples=column_samples,
+                    )
+                except Exception as exc:
+                    logger.error(
+                        "Failed to annotate table '%s' (schema '%s') in database '%s': %s",
+                        table_name,
+                        schema,
+                        database,
+                        exc,
+                        exc_info=False,
+                    )
+                    return None
+
+        async def annotate_batch_with_limit(batch: list[_TableContext]):
+            try:
+                return await self._annotate_batch(database, batch, semaphore)
+            except Exception as exc:
+                # Keep the other batches of this database going
+                logger.error(
+                    "Failed to annotate %d tables in database '%s': %s",
+                    len(batch),
                     database,
-                    schema,
-                    table_name,
-                    skip_if_exists=skip_if_exists,
+                    exc,
+                    exc_info=False,
                 )
+                return []
 
-        annotations: list[TableAnnotation] = []
-        tasks = [
-            annotate_with_limit(schema, table_name)
+        prepare_tasks = [
+            asyncio.create_task(prepare_with_limit(schema, table_name))
             for schema, table_name in table_targets
         ]
-
-        results = await asyncio.gather(*tasks)
+        batch_tasks: list[asyncio.Task[None]] = []
+        finished: asyncio.Queue[list[TableAnnotation] | None] = asyncio.Queue()
+
+        async def annotate_into_queue(batch: list[_TableContext]) -> None:
+            await finished.put(await annotate_batch_with_limit(batch))
+
+        async def schedule_batches() -> None:
+            # Batches go to the LLM as soon as enough tables are prepared, rather
+            # than after every preview and sample has been read
+            try:
+                batch: list[_TableContext] = []
+                for next_prepared in asyncio.as_completed(prepare_tasks):
+                    if (context := await next_prepared) is None:
+                        continue
+                    batch.append(context)
+                    if len(batch) == batch_size:
+                        batch_tasks.append(
+                            asyncio.create_task(annotate_into_queue(batch))
+                        )
+                        batch = []
+                if batch:
+                    batch_tasks.append(asyncio.create_task(annotate_into_queue(batch)))
+                await asyncio.gather(*batch_tasks)
+            finally:
+                await finished.put(None)
+
+        scheduler = asyncio.create_task(schedule_batches())
         successful = 0
-        skipped = 0
-        for result in results:
-            if result is not None:
-                annotations.append(result)
-                successful += 1
-            else:
-                # Could be skipped or failed (both return None)
-                skipped += 1
+        try:
+            while (annotations := await finished.get()) is not None:
+                for annotation in annotations:
+                    successful += 1
+                    yield annotation
+            await scheduler
+        finally:
+            # Stop outstanding work if the consumer goes away early
+            for task in (scheduler, *prepare_tasks, *batch_tasks):
+                task.cancel()
+
+        # Could be skipped or failed
+        skipped = len(table_targets) - successful
 
         if skipped > 0:
             logger.debug(
@@ -182,8 +253,6 @@ class AnnotationService:
                 len(table_targets),
             )
 
-        return annotations
-
     async def save_with_embeddings(
         self, annotations: list[TableAnnotation] | TableAnnotation
     ) -> None:
@@ -197,16 +266,36 @@ class AnnotationService:
         if not annotations:
             return
 
-        descriptions = [a.description for a in annotations]
+        await self._attach_embeddings(annotations)
+        await self.annotation_repo.save_batch(annotations)
+
+    async def _attach_embeddings(self, annotations: list[TableAnnotation]) -> None:
+        # Identical descriptions (e.g. views over one base table) are encoded once
+        descriptions = list(dict.fromkeys(a.description for a in annotations))
         embeddings = await self.embedding_gen.generate_batch(
-            descriptions, batch_size=32
+            descriptions,
+            batch_size=settings.embedding_batch_size,
+            precision=settings.embedding_precision,
         )
+        by_description = dict(zip(descriptions, embeddings))
+        for annotation in annotations:
+            annotation.embeddings = by_description[annotation.description]
 
-        # Attach embeddings
-        for annotation, embedding in zip(annotations, embeddings):
-            annotation.embeddings = embedding
+    async def migrate_stored_annotations(self) -> None:
+        """Re-embed stored descriptions after `n_dims` or `embedding_precision` changed.
 
-        await self.annotation_repo.save_batch(annotations)
+        The descriptions themselves are kept, so no table is sent to the LLM again.
+        """
+
+        async def embed(descriptions: list[str]):
+            return await self.embedding_gen.generate_batch(
+                descriptions,
+                batch_size=settings.embedding_batch_size,
+                precision=settings.embedding_precision,
+            )
+
+        if await self.annotation_repo.migrate(embed):
+            clear_table_description_cache()
 
     async def store_table_descriptions(self) -> None:
         """Store table descriptions for all configured databases in LanceDB."""
@@ -228,69 +317,310 @@ class AnnotationService:
         db = get_lance_db()
         open_or_create_table(db, "table_annotations", TableAnnotation)
 
-        save_tasks: list[asyncio.Task[None]] = []
-        for database in database_names:
-            annotations = await self.annotate_database(database, skip_if_exists=True)
-            if not annotations:
+        # Databases are annotated side by side, sharing the overall concurrency budget
+        max_concurrent = max(
+            1, settings.max_concurrent_annotations // len(database_names)
+        )
+        # LLM output -> embedding -> LanceDB as bounded stages that overlap
+        annotated: asyncio.Queue[TableAnnotation | None] = asyncio.Queue(
+            maxsize=settings.embedding_batch_size
+        )
+        embedded: asyncio.Queue[TableAnnotation | None] = asyncio.Queue(
+            maxsize=_SAVE_CHUNK_SIZE
+        )
+
+        async def annotate_into_queue(database: str) -> None:
+            produced = 0
+            try:
+                async for annotation in self.annotate_database(
+                    database, skip_if_exists=True, max_concurrent=max_concurrent
+                ):
+                    produced += 1
+                    await annotated.put(annotation)
+            except Exception:
+                # One unreachable database must not stop the others from saving
+                logger.exception("Failed to annotate database '%s'", database)
+                return
+            if not produced:
                 logger.info(
                     "Database '%s' already has up-to-date annotations, skipping save.",
                     database,
                 )
-                continue
 
-            save_tasks.append(
-                asyncio.create_task(self.save_with_embeddings(annotations))
+        # A failing stage cancels the rest instead of leaving producers blocked
+        async with asyncio.TaskGroup() as stages:
+            stages.create_task(self._embed_stage(annotated, embedded))
+            saver = stages.create_task(self._save_stage(embedded))
+            await asyncio.gather(
+                *(annotate_into_queue(database) for database in database_names)
             )
+            await annotated.put(None)
 
-        if save_tasks:
-            await asyncio.gather(*save_tasks)
+        if saved := saver.result():
             clear_table_description_cache()
-            logger.info("Finished persisting new table annotations.")
+            logger.info("Finished persisting %d new table annotations.", saved)
         else:
             logger.info("No new table annotations were generated.")
 
-    async def _generate_description(
+    async def _embed_stage(
+        self,
+        source: asyncio.Queue[TableAnnotation | None],
+        sink: asyncio.Queue[TableAnnotation | None],
+    ) -> None:
+        """Embed whatever annotations are queued, up to one encode batch at a time."""
+        while chunk := await _take_chunk(source, settings.embedding_batch_size):
+            await self._attach_embeddings(chunk)
+            for annotation in chunk:
+                await sink.put(annotation)
+        await sink.put(None)
+
+    async def _save_stage(self, source: asyncio.Queue[TableAnnotation | None]) -> int:
+        """Save embedded annotations as they arrive, returning how many were written."""
+        saved = 0
+        while chunk := await _take_chunk(source, _SAVE_CHUNK_SIZE):
+            await self.annotation_repo.save_batch(chunk)
+            saved += len(chunk)
+        return saved
+
+    async def _prepare_table(
         self,
         database: str,
         schema: str,
         table_name: str,
-        metadata,
-        preview: list[dict],
-        column_samples: list[str],
-    ) -> str:
-        """Use the annotation agent to generate a table description."""
-        prompt = (
-            f"""
-        For the table named '{table_name}' in the database '{database}' schema '{schema}',
-        generate a concise description based on the following metadata and data preview.
-        <metadata>
-        {metadata.to_create_table(table_name=f"{schema}.{table_name}")}
-        </metadata>
-        <preview>
-        {preview}
-        </preview>
-        The following are samples of distinct values from the tables non-numeric columns:
-        <distinct_values>
-        {column_samples}
-        </distinct_values>
+        *,
+        skip_if_exists: bool = False,
+        metadata: TableMetadata | None = None,
+        known_hashes: set[str] | None = None,
+        column_samples: Callable[[], Awaitable[_ColumnSamples]] | None = None,
+    ) -> _TableContext | None:
+        """Collect everything needed to describe a table, or None if up-to-date.
+
+        `metadata` may be passed in when it was already reflected by the caller.
+        `known_hashes` holds the database's stored schema hashes; without it each
+        table is checked against LanceDB individually. `column_samples` returns
+        samples for the whole database keyed by (schema, table); without it the
+        table's samples are fetched on their own.
         """
-        ).strip()
+        if metadata is None:
+            metadata = await asyncio.to_thread(
+                _fetch_metadata, database, schema, table_name
+            )
 
         logger.debug(
-            "Prompt for table '%s' (schema '%s') in database '%s': %s",
+            "Annotating table '%s' (schema '%s') in database '%s'.",
             table_name,
             schema,
             database,
+        )
+
+        # Check if already exists
+        schema_hash: str | None = None
+        if skip_if_exists:
+            schema_hash = self.annotation_repo.compute_schema_hash(
+                database, schema, table_name, metadata
+            )
+            if known_hashes is not None:
+                is_current = schema_hash in known_hashes
+            else:
+                is_current = await self.annotation_repo.exists_by_schema_hash(
+                    schema_hash
+                )
+            if is_current:
+                logger.debug(
+                    (
+                        "Annotation for table '%s' (schema '%s') in database '%s'"
+                        " is up-to-date, skipping."
+                    ),
+                    table_name,
+                    schema,
+                    database,
+                )
+                return None
+
+        preview = await asyncio.to_thread(_fetch_preview, database, schema, table_name)
+
+        # Get column content samples
+        if column_samples is not None:
+            samples = (await column_samples()).get((schema, table_name), [])
+        else:
+            column_repo = ColumnContentRepository(database, schema=schema)
+            samples = await self._get_column_samples(column_repo, table_name, schema)
+
+        return _TableContext(
+            schema=schema,
+            table_name=table_name,
+            metadata=metadata,
+            preview=preview,
+            column_samples=samples,
+            schema_hash=schema_hash,
+        )
+
+    async def _annotate_batch(
+        self,
+        database: str,
+        batch: list[_TableContext],
+        semaphore: asyncio.Semaphore,
+    ) -> list[TableAnnotation]:
+        """Describe a batch of tables, falling back to per-table calls on failure.
+
+        Every LLM call, including each fallback call, takes its own semaphore slot.
+        """
+
+        async def describe_one(context: _TableContext) -> str | None:
+            async with semaphore:
+                return await self._generate_description_or_none(database, context)
+
+        descriptions: list[str | None]
+        try:
+            async with semaphore:
+                if len(batch) == 1:
+                    descriptions = [
+                        await self._generate_description(database, batch[0])
+                    ]
+                else:
+                    descriptions = list(
+                        await self._generate_batch_descriptions(database, batch)
+                    )
+        except Exception as exc:
+            logger.warning(
+                "Batch annotation of %d tables in database '%s' failed (%s); "
+                "falling back to per-table calls.",
+                len(batch),
+                database,
+                exc,
+            )
+            descriptions = list(
+                await asyncio.gather(*(describe_one(context) for context in batch))
+            )
+
+        return [
+            self._to_annotation(database, context, description)
+            for context, description in zip(batch, descriptions, strict=True)
+            if description is not None
+        ]
+
+    def _to_annotation(
+        self, database: str, context: _TableContext, description: str
+    ) -> TableAnnotation:
+        return TableAnnotation(
+            database_name=database,
+            schema_name=context.schema,
+            table_name=context.table_name,
+            description=description,
+            metadata_json=context.metadata.metadata_json,
+            embeddings=None,  # to be filled later
+            schema_hash=context.schema_hash,
+        )
+
+    def _build_table_prompt(self, database: str, context: _TableContext) -> str:
+        schema, table_name = context.schema, context.table_name
+        create_table = context.metadata.to_create_table(
+            table_name=f"{schema}.{table_name}"
+        )
+        distinct_values = "\n".join(context.column_samples)
+        # Flush-left so no indentation or escaped newlines end up in the token count
+        return (
+            f"For the table named '{table_name}' in the database '{database}'"
+            f" schema '{schema}', generate a concise description based on the"
+            " following metadata and data preview.\n"
+            f"<metadata>\n{create_table}\n</metadata>\n"
+            f"<preview>\n{context.preview}\n</preview>\n"
+            "The following are samples of distinct values from the tables"
+            " non-numeric columns:\n"
+            f"<distinct_values>\n{distinct_values}\n</distinct_values>"
+        )
+
+    async def _generate_description(self, database: str, context: _TableContext) -> str:
+        """Use the annotation agent to generate a table description."""
+        table_name = context.table_name
+        prompt = self._build_table_prompt(database, context)
+
+        logger.debug(
+            "Prompt for table '%s' (schema '%s') in database '%s': %s",
+            table_name,
+            context.schema,
+            database,
             prompt,
         )
 
         result = await table_annotation_agent.run(prompt)
 
+        usage = result.usage()
+        logger.debug(
+            "Annotation of table '%s' used %d input tokens (%d served from prompt cache).",
+            table_name,
+            usage.input_tokens,
+            usage.cache_read_tokens,
+        )
+
         if not isinstance(result.output, TableDescriptionModel):
             raise RuntimeError("Annotation agent did not return TableDescription.")
 
         return result.output.description
 
+    async def _generate_description_or_none(
+        self, database: str, context: _TableContext
+    ) -> str | None:
+        try:
+            return await self._generate_description(database, context)
+        except Exception as exc:
+            logger.error(
+                "Failed to annotate table '%s' (schema '%s') in database '%s': %s",
+                context.table_name,
+                context.schema,
+                database,
+                exc,
+                exc_info=False,
+            )
+            return None
+
+    async def _generate_batch_descriptions(
+        self, database: str, batch: list[_TableContext]
+    ) -> list[str]:
+        """Use the batch annotation agent to describe several tables in one call."""
+        names = [f"{context.schema}.{context.table_name}" for context in batch]
+        sections = "\n".join(
+            f'<Table {i} name="{name}">\n'
+            f"{self._build_table_prompt(database, context)}\n</Table {i}>"
+            for i, (name, context) in enumerate(zip(names, batch), start=1)
+        )
+        prompt = (
+            f"Describe each of the following {len(batch)} tables, "
+            f"returning the descriptions in the same order.\n{sections}"
+        )
+
+        logger.debug(
+            "Batch prompt for %d tables in database '%s': %s",
+            len(batch),
+            database,
+            prompt,
+        )
+
+        result = await batch_table_annotation_agent.run(prompt)
+
+        usage = result.usage()
+        logger.debug(
+            "Batch annotation of %d tables used %d input tokens (%d served from prompt cache).",
+            len(batch),
+            usage.input_tokens,
+            usage.cache_read_tokens,
+        )
+
+        if not isinstance(result.output, TableDescriptionBatch):
+            raise RuntimeError(
+                "Batch annotation agent did not return TableDescriptionBatch."
+            )
+
+        # Matched by name, not position, so reordered output cannot mislabel tables
+        by_name = {item.table_name: item.description for item in result.output.tables}
+        if len(by_name) != len(result.output.tables) or by_name.keys() != set(names):
+            raise ValueError(
+                f"Batch descriptions do not match the requested tables: "
+                f"expected {names}, got {[item.table_name for item in result.output.tables]}."
+            )
+
+        return [by_name[name] for name in names]
+
     async def _get_column_samples(
         self,
         column_repo: ColumnContentRepository,
@@ -306,12 +636,7 @@ class AnnotationService:
                 columns=["column_name", "content", "num_distinct"],
             )
 
-            return [
-                f"Column: {row['column_name']}\n"
-                f"Sample values (showing {min(limit, row['num_distinct'])} of {row['num_distinct']}): "
-                f"{row['content'][:limit]}"
-                for row in results
-            ]
+            return [_format_column_sample(row, limit) for row in results]
         except ValueError:
             logger.warning(
                 "Column contents not indexed for %s.%s.%s",
@@ -321,8 +646,91 @@ class AnnotationService:
             )
             return []
 
+    async def _get_database_column_samples(
+        self, database: str, limit: int = 10
+    ) -> _ColumnSamples:
+        """Get column content samples for every table of a database in one scan."""
+        column_repo = ColumnContentRepository(database)
+        try:
+            results = await column_repo.get_all(
+                columns=[
+                    "schema_name",
+                    "table_name",
+                    "column_name",
+                    "content",
+                    "num_distinct",
+                ],
+                max_values=limit,
+            )
+        except ValueError:
+            logger.warning("Column contents not indexed for database '%s'", database)
+            return {}
+
+        samples: _ColumnSamples = {}
+        for row in results:
+            samples.setdefault((row["schema_name"], row["table_name"]), []).append(
+                _format_column_sample(row, limit)
+            )
+        return samples
+
+
+def _discover_tables(
+    database: str, schemas: Sequence[str]
+) -> tuple[list[tuple[str, str]], dict[tuple[str, str], TableMetadata]]:
+    """List (schema, table) targets and their reflected metadata in one connection."""
+    targets: list[tuple[str, str]] = []
+    metadata: dict[tuple[str, str], TableMetadata] = {}
+    with connection_scope(database) as conn:
+        for schema in schemas:
+            names = list_tables(conn, schema=schema)
+            targets.extend((schema, name) for name in names)
+            snapshot = get_schema_metadata(conn, schema)
+            metadata.update(
+                ((schema, name), snapshot[name]) for name in names if name in snapshot
+            )
+    return targets, metadata
+
+
+def _fetch_metadata(database: str, schema: str, table_name: str) -> TableMetadata:
+    with connection_scope(database) as conn:
+        return get_table_metadata(conn, table_name, schema=schema)
+
+
+def _fetch_preview(database: str, schema: str, table_name: str) -> list[dict]:
+    with connection_scope(database) as conn:
+        # A few short cells are enough for the model to infer what a column holds
+        return get_table_preview(
+            conn, table_name, schema=schema, limit=5, max_field_length=80
+        )
+
+
+def _format_column_sample(row: dict, limit: int) -> str:
+    return (
+        f"Column: {row['column_name']}\n"
+        f"Sample values (showing {min(limit, row['num_distinct'])} of {row['num_distinct']}): "
+        f"{row['content'][:limit]}"
+    )
+
+
+async def _take_chunk(
+    queue: asyncio.Queue[TableAnnotation | None], limit: int
+) -> list[TableAnnotation]:
+    """Wait for one item, then take whatever else is ready, up to `limit` items.
+
+    Returns an empty list once the None sentinel is reached; the sentinel is put
+    back so every later call sees the queue as closed.
+    """
+    item = await queue.get()
+    chunk: list[TableAnnotation] = []
+    while item is not None:
+        chunk.append(item)
+        if len(chunk) >= limit or queue.empty():
+            return chunk
+        item = queue.get_nowait()
+    queue.put_nowait(None)
+    return chunk
+
 
-@lru_cache(maxsize=32)
 def get_table_descriptions(
     database: str, targets: tuple[tuple[str, str], ...]
 ) -> list[TableDescription]:
@@ -333,12 +741,36 @@ def get_table_descriptions(
     if not targets:
         return []
 
-    db = get_lance_db()
-    table_annotations = open_or_create_table(db, "table_annotations", TableAnnotation)
+    lookup = _description_lookup(database, _annotations_version())
+    return [
+        TableDescription(
+            schema_name=schema,
+            table_name=table,
+            description=lookup.get((schema, table)),
+        )
+        for schema, table in targets
+    ]
+
+
+@cache
+def _annotations_table() -> Table:
+    return open_or_create_table(get_lance_db(), "table_annotations", TableAnnotation)
 
+
+def _annotations_version() -> int:
+    """Latest version of the annotations table, so writes from any process show up."""
+    table = _annotations_table()
+    table.checkout_latest()
+    return table.version
+
+
+@lru_cache(maxsize=16)
+def _description_lookup(database: str, version: int) -> dict[tuple[str, str], str]:
+    """Load every stored description of a database once per table version."""
     records = (
-        table_annotations.search()
-        .where(f"database_name = '{database}'")
+        _annotations_table()
+        .search()
+        .where(eq_filter(database_name=database))
         .select(["schema_name", "table_name", "description"])
         .to_list()
     )
@@ -346,24 +778,15 @@ def get_table_descriptions(
     if len(records) == 0:
         logger.warning("No table descriptions found for database: %s", database)
 
-    lookup = {
+    return {
         (record["schema_name"], record["table_name"]): record["description"]
         for record in records
     }
 
-    return [
-        TableDescription(
-            schema_name=schema,
-            table_name=table,
-            description=lookup.get((schema, table)),
-        )
-        for schema, table in targets
-    ]
-
 
 def clear_table_description_cache() -> None:
     """Clear the cached table descriptions."""
-    get_table_descriptions.cache_clear()
+    _description_lookup.cache_clear()
 
 
 # Factory for dependency injection
@@ -0,0 +1,99 @@
+import time
+from collections.abc import Sequence
+from functools import cache
+
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelMessage
+
+from app.agents.data_agent import data_agent
+from app.repositories.qa_cache import QACacheRepository
+from app.models.lance import QACacheEntry
+from app.domain.embed import EmbeddingGenerator
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+
+class CachingAgent:
+    """Data agent wrapper that answers near-duplicate questions from a semantic cache."""
+
+    def __init__(
+        self,
+        agent: Agent[None, str],
+        qa_cache_repo: QACacheRepository,
+        embedding_gen: EmbeddingGenerator,
+    ):
+        self.agent = agent
+        self.qa_cache_repo = qa_cache_repo
+        self.embedding_gen = embedding_gen
+
+    async def run(
+        self,
+        question: str,
+        *,
+        database: str | None = None,
+        message_history: Sequence[ModelMessage] | None = None,
+    ) -> str:
+        """Answer a question, reusing a cached answer for paraphrased questions.
+
+        Answers are cached per database. Follow-up questions depend on their
+        conversation, so runs with `message_history` bypass the cache.
+        """
+        prompt = (
+            question
+            if database is None
+            else f"Answer using the '{database}' database.\n{question}"
+        )
+        if message_history:
+            result = await self.agent.run(prompt, message_history=message_history)
+            return result.output
+
+        embedding = await self.embedding_gen.generate(question)
+        min_ts = time.time() - settings.qa_cache_ttl_seconds
+        cached = await self.qa_cache_repo.find_answer(
+            embedding,
+            database=database or "",
+            max_distance=settings.qa_cache_max_distance,
+            min_ts=min_ts,
+        )
+        if cached is not None:
+            logger.debug("Semantic cache hit for question: %s", question)
+            return cached
+
+        result = await self.agent.run(prompt)
+        answer = result.output
+
+        await self.qa_cache_repo.save(
+            QACacheEntry(
+                database_name=database or "",
+                question=question,
+                embeddings=embedding,
+                answer=answer,
+                ts=time.time(),
+            ),
+            expire_before=min_ts,
+        )
+        return answer
+
+    async def migrate_cache(self) -> None:
+        """Re-embed cached questions after `n_dims` changed."""
+
+        async def embed(questions: list[str]):
+            return await self.embedding_gen.generate_batch(
+                questions, batch_size=settings.embedding_batch_size
+            )
+
+        await self.qa_cache_repo.migrate(embed)
+
+
+# Factory for dependency injection, shared so the cache table is opened once
+@cache
+def get_caching_data_agent() -> CachingAgent:
+    """Create the cached data agent with dependencies."""
+    return CachingAgent(
+        agent=data_agent,
+        qa_cache_repo=QACacheRepository(),
+        embedding_gen=EmbeddingGenerator(),
+    )
@@ -18,7 +18,9 @@ class SearchService:
     ) -> list[str]:
         """Search for column contents matching query."""
         repo = ColumnContentRepository(database, schema=schema)
-        results = repo.search_fts(query, schema=schema, top_k=top_k)
+        results = repo.search_fts(
+            query, schema=schema, top_k=top_k, max_values=max_values_shown
+        )
 
         if not results:
             return []
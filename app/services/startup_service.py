@@ -1,4 +1,5 @@
 import asyncio
+import logging
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -17,67 +18,103 @@ async def initialize_database_schemas() -> None:
         return
 
     database_names = registry.names()
-    tasks = [
-        asyncio.to_thread(_resolve_schemas_for_database, registry, name)
-        for name in database_names
-    ]
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for name, result in zip(database_names, results, strict=True):
-        if isinstance(result, BaseException):
-            raise result
-        schemas, default_schema = result
-        registry.set_schema_names(name, schemas)
-        if default_schema is not None:
-            registry.set_default_schema(name, default_schema)
-        logger.debug(
-            "Database '%s' schemas initialized: %s (default: %s)",
-            name,
-            schemas,
-            default_schema,
-        )
-
-
-def _resolve_schemas_for_database(
-    registry: DatabaseRegistry, database: str
-) -> tuple[tuple[str, ...], str | None]:
-    config = registry.get(database)
+    # Aliases of one physical database share a single catalog query
+    by_url: dict[str, list[str]] = {}
+    for name in database_names:
+        by_url.setdefault(registry.get(name).url, []).append(name)
+
+    async def discover(names: list[str]) -> tuple[list[str], tuple]:
+        # A hung handshake must not hold readiness hostage; the worker thread
+        # is abandoned on timeout and startup fails with a clear error instead
+        try:
+            discovery = await asyncio.wait_for(
+                asyncio.to_thread(_discover_schemas, names[0]),
+                timeout=settings.schema_discovery_timeout_s,
+            )
+        except TimeoutError as exc:
+            raise TimeoutError(
+                f"Schema discovery for database '{names[0]}' timed out after "
+                f"{settings.schema_discovery_timeout_s:g} seconds."
+            ) from exc
+        return names, discovery
+
+    tasks = [asyncio.create_task(discover(names)) for names in by_url.values()]
+    try:
+        # Register each database as soon as its discovery lands
+        for next_done in asyncio.as_completed(tasks):
+            names, discovery = await next_done
+            for name in names:
+                schemas, default_schema, missing = _apply_schema_config(
+                    registry, name, *discovery
+                )
+                registry.set_schema_names(name, schemas)
+                if default_schema is not None:
+                    registry.set_default_schema(name, default_schema)
+                # One record per database; escalated when configuration was ignored
+                server_default = discovery[1]
+                fallback = len(schemas) > 1 and server_default not in (
+                    None,
+                    default_schema,
+                )
+                logger.log(
+                    logging.WARNING if missing or fallback else logging.DEBUG,
+                    "Database '%s' schemas initialized: %s (default: %s, "
+                    "server default: %s, configured but missing: %s)",
+                    name,
+                    schemas,
+                    default_schema,
+                    server_default,
+                    missing,
+                )
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _discover_schemas(database: str) -> tuple[tuple[str, ...], str | None]:
+    """Query the server for its schema names and default schema."""
     with connection_scope(database) as conn:
         inspector = get_inspector(conn)
-        raw_schemas = tuple(dict.fromkeys(list_schemas(conn)))
         discovered = tuple(
-            schema
-            for schema in raw_schemas
-            if schema is not None and str(schema).strip() != ""
+            dict.fromkeys(
+                schema
+                for schema in list_schemas(conn)
+                if schema is not None and str(schema).strip()
+            )
         )
         default_schema = inspector.default_schema_name or None
         if isinstance(default_schema, str) and default_schema.strip() == "":
             default_schema = None
 
+    return discovered, default_schema
+
+
+def _apply_schema_config(
+    registry: DatabaseRegistry,
+    database: str,
+    discovered: tuple[str, ...],
+    default_schema: str | None,
+) -> tuple[tuple[str, ...], str | None, tuple[str, ...]]:
+    """Narrow discovered schemas to the configuration and pick a default.
+
+    Returns the usable schemas, the resolved default and any configured
+    schemas that the server does not have.
+    """
+    config = registry.get(database)
     if not discovered and default_schema:
         discovered = (default_schema,)
 
     if not discovered:
-        logger.warning(
-            "No schemas discovered for database '%s'; downstream components may fail.",
-            database,
-        )
         raise ValueError(f"No schemas discovered for database '{database}'.")
 
     configured = config.schemas
+    missing: tuple[str, ...] = ()
     if configured is None:
         schemas = discovered
     else:
-        matched = tuple(name for name in configured if name in discovered)
-        missing = tuple(name for name in configured if name not in discovered)
-
-        if missing:
-            logger.warning(
-                "Database '%s': configured schemas not found and will be ignored: %s",
-                database,
-                missing,
-            )
+        available = frozenset(discovered)
+        matched = tuple(name for name in configured if name in available)
+        missing = tuple(name for name in configured if name not in available)
 
         if not matched:
             raise ValueError(
@@ -96,13 +133,6 @@ def _resolve_schemas_for_database(
     elif len(schemas) == 1:
         resolved_default = schemas[0]
     else:
-        if default_schema is not None:
-            logger.warning(
-                "Database '%s': default schema '%s' is not available; falling back to '%s'.",
-                database,
-                default_schema,
-                schemas[0],
-            )
         resolved_default = schemas[0]
 
-    return schemas, resolved_default
+    return schemas, resolved_default, missing